@@ -18,12 +18,12 @@ import subprocess
 import glob
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union, Tuple
-from collections import defaultdict
 
 import psycopg2
 import psycopg2.extras
 from psycopg2 import sql
 import pandas as pd
+import yaml
 from jobspy import scrape_jobs
 
 import warnings
@@ -138,6 +138,7 @@ class JobDatabase:
         self.db_config = DatabaseConfig(config_path, database_type)
         self.database_type = database_type
         self.conn = None
+        self._prepared_statements = set()
         self._connect_with_retry()
         self.create_tables()
         logger.info(f"PostgreSQL database initialized ({database_type})")
@@ -153,6 +154,8 @@ class JobDatabase:
                 conn_params = self.db_config.get_connection_params()
                 self.conn = psycopg2.connect(**conn_params)
                 self.conn.autocommit = False
+                # Prepared statements are per-session and do not survive a reconnect
+                self._prepared_statements = set()
                 logger.info(f"Connected to PostgreSQL database successfully")
                 return
             except psycopg2.Error as e:
@@ -172,6 +175,19 @@ class JobDatabase:
             logger.warning("Database connection error, reconnecting...")
             self._connect_with_retry()
 
+    def _prepare_statement(self, cursor, name: str, param_types: str, statement: str) -> None:
+        """PREPARE a named server-side statement once per connection.
+        
+        Args:
+            cursor: Cursor to issue the PREPARE on
+            name: Name of the prepared statement
+            param_types: Comma-separated parameter types (e.g., 'numeric, numeric')
+            statement: Statement body using $1, $2, ... placeholders
+        """
+        if name not in self._prepared_statements:
+            cursor.execute(f"PREPARE {name} ({param_types}) AS {statement}")
+            self._prepared_statements.add(name)
+
     def create_backup(self, backup_type: str = 'auto', reason: str = '') -> Dict:
         """Create a PostgreSQL backup using pg_dump.
         
@@ -566,6 +582,69 @@ class JobDatabase:
             )
             ''')
             
+            # Create dedup_state table (single row holding the incremental duplicate-scan watermark)
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS dedup_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                watermark TIMESTAMP
+            )
+            ''')
+            
+            # Duplicate ranking runs server-side. Jobs sharing a (title, company) key form a group,
+            # ranked best-first by the keep-preference order:
+            #   1. has a description  2. Colorado location  3-4. highest min_amount (salary > 0 first)
+            #   5. remote  6. search query not 'United States'  7. site (linkedin, indeed, google)
+            #   8. most recent date_posted
+            # When since is given, only groups touched by jobs scraped after it are ranked.
+            cursor.execute('''
+            CREATE OR REPLACE FUNCTION rank_duplicate_jobs(since TIMESTAMP DEFAULT NULL)
+            RETURNS TABLE (job_id TEXT, group_rank BIGINT)
+            LANGUAGE sql STABLE AS $$
+                WITH keyed AS (
+                    SELECT j.*, LOWER(TRIM(j.title)) AS title_key, LOWER(TRIM(j.company)) AS company_key
+                    FROM scraped_jobs j
+                    WHERE j.title IS NOT NULL AND j.company IS NOT NULL
+                      AND (since IS NULL OR (LOWER(TRIM(j.title)), LOWER(TRIM(j.company))) IN (
+                          SELECT LOWER(TRIM(n.title)), LOWER(TRIM(n.company))
+                          FROM scraped_jobs n
+                          WHERE n.date_scraped > since AND n.title IS NOT NULL AND n.company IS NOT NULL
+                      ))
+                ),
+                grouped AS (
+                    SELECT k.*, COUNT(*) OVER (PARTITION BY k.title_key, k.company_key) AS group_size
+                    FROM keyed k
+                )
+                SELECT g.id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY g.title_key, g.company_key
+                           ORDER BY
+                               (g.description IS NOT NULL AND TRIM(g.description) <> '') DESC,
+                               (LOWER(g.location) LIKE '%, co%' OR LOWER(g.location) LIKE '%colorado%') IS TRUE DESC,
+                               COALESCE(g.min_amount, 0) DESC,
+                               g.is_remote IS TRUE DESC,
+                               (LOWER(g.search_query) LIKE '%united states%') IS TRUE,
+                               CASE LOWER(g.site) WHEN 'linkedin' THEN 1 WHEN 'indeed' THEN 2 WHEN 'google' THEN 3 ELSE 4 END,
+                               NULLIF(TRIM(g.date_posted), '') DESC NULLS LAST,
+                               g.title, g.company, g.site, g.id
+                       )
+                FROM grouped g
+                WHERE g.group_size > 1
+            $$
+            ''')
+            
+            # Delete every duplicate except the best-ranked job of each group in one call
+            cursor.execute('''
+            CREATE OR REPLACE PROCEDURE delete_duplicate_jobs(since TIMESTAMP, INOUT deleted_count INTEGER DEFAULT NULL)
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                DELETE FROM scraped_jobs s
+                USING rank_duplicate_jobs(since) r
+                WHERE s.id = r.job_id AND r.group_rank > 1;
+                GET DIAGNOSTICS deleted_count = ROW_COUNT;
+            END
+            $$
+            ''')
+            
             # Ensure pg_trgm extension exists (for text similarity and pattern matching)
             cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
             
@@ -592,11 +671,29 @@ class JobDatabase:
                 # GIN index with pg_trgm for efficient ILIKE pattern matching on description
                 "CREATE INDEX IF NOT EXISTS idx_scraped_jobs_description_gin ON scraped_jobs USING gin (description gin_trgm_ops)",
                 
+                # Title pattern indexes for --delete-by-title and its preview, which match LOWER(title) LIKE:
+                # btree with text_pattern_ops serves 'abc%' prefixes, trigram GIN serves '%abc%' and '%abc'
+                "CREATE INDEX IF NOT EXISTS idx_scraped_jobs_title_lower_pattern ON scraped_jobs(LOWER(title) text_pattern_ops)",
+                "CREATE INDEX IF NOT EXISTS idx_scraped_jobs_title_lower_trgm ON scraped_jobs USING gin (LOWER(title) gin_trgm_ops)",
+                
+                # Company pattern indexes for --delete-by-company and the preview's company simulation,
+                # which match LOWER(company) LIKE the same way
+                "CREATE INDEX IF NOT EXISTS idx_scraped_jobs_company_lower_pattern ON scraped_jobs(LOWER(company) text_pattern_ops)",
+                "CREATE INDEX IF NOT EXISTS idx_scraped_jobs_company_lower_trgm ON scraped_jobs USING gin (LOWER(company) gin_trgm_ops)",
+                
                 # Search history indexes
                 "CREATE INDEX IF NOT EXISTS idx_search_history_search_query ON search_history(search_query)",
                 "CREATE INDEX IF NOT EXISTS idx_search_history_timestamp ON search_history(timestamp)"
             ]
             
+            # Expression indexes have no planner statistics until the table is analyzed, so
+            # analyze once when either group of pattern indexes (title or company) is first built
+            cursor.execute("""
+                SELECT to_regclass('idx_scraped_jobs_title_lower_trgm') IS NULL
+                    OR to_regclass('idx_scraped_jobs_company_lower_trgm') IS NULL
+            """)
+            pattern_indexes_missing = cursor.fetchone()[0]
+            
             for query in index_queries:
                 try:
                     cursor.execute(query)
@@ -605,6 +702,12 @@ class JobDatabase:
                     logger.warning(f"Index creation warning: {e}")
                     # Continue with other indexes even if one fails
             
+            if pattern_indexes_missing:
+                try:
+                    cursor.execute("ANALYZE scraped_jobs")
+                except Exception as e:
+                    logger.warning(f"ANALYZE warning: {e}")
+            
             self.conn.commit()
             logger.info("Database tables and indexes created/verified successfully")
         
@@ -733,37 +836,55 @@ class JobDatabase:
         query = "SELECT * FROM scraped_jobs WHERE search_query = %s"
         return pd.read_sql(query, self.conn, params=(search_query,))
     
-    def get_duplicate_groups(self) -> List[List[Dict]]:
-        """Identify groups of duplicate jobs based on title and company.
+    def get_duplicate_rankings(self, since: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        """Rank jobs within each duplicate (title, company) group.
+        
+        Args:
+            since: If provided, only rank groups containing at least one job
+                scraped after this timestamp (incremental scan)
         
         Returns:
-            List of groups, where each group is a list of job dictionaries
+            List of (job_id, group_rank) tuples; rank 1 is the job to keep
         """
         self._ensure_connection()
         
-        query = """
-        SELECT id, site, title, company, description, min_amount, max_amount, job_url, is_remote, location, search_query, date_posted
-        FROM scraped_jobs 
-        WHERE title IS NOT NULL AND company IS NOT NULL
-        ORDER BY title, company, site
-        """
+        with self.conn.cursor() as cursor:
+            cursor.execute("SELECT job_id, group_rank FROM rank_duplicate_jobs(%s)", (since,))
+            return cursor.fetchall()
+    
+    def get_dedup_watermark(self) -> Optional[datetime]:
+        """Get the timestamp of the last completed duplicate cleanup.
         
-        with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-            cursor.execute(query)
-            rows = cursor.fetchall()
+        Returns:
+            Watermark timestamp, or None if duplicates have never been cleaned
+        """
+        self._ensure_connection()
         
-        # Group jobs by (title, company) combination
-        groups = defaultdict(list)
-        for row in rows:
-            job_dict = dict(row)
-            key = (row['title'].strip().lower() if row['title'] else '', 
-                   row['company'].strip().lower() if row['company'] else '')
-            groups[key].append(job_dict)
+        with self.conn.cursor() as cursor:
+            cursor.execute("SELECT watermark FROM dedup_state WHERE id = 1")
+            row = cursor.fetchone()
+            
+        return row[0] if row else None
+    
+    def set_dedup_watermark(self, watermark: datetime) -> None:
+        """Record the timestamp of a completed duplicate cleanup.
         
-        # Filter out groups with only one job (not duplicates)
-        duplicate_groups = [group for group in groups.values() if len(group) > 1]
+        Args:
+            watermark: Time the duplicate scan started
+        """
+        self._ensure_connection()
         
-        return duplicate_groups
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO dedup_state (id, watermark) VALUES (1, %s)
+                ON CONFLICT (id) DO UPDATE SET watermark = EXCLUDED.watermark
+                """,
+                (watermark,)
+            )
+            self.conn.commit()
+            
+        logger.info(f"Duplicate scan watermark set to {watermark}")
     
     def clear_all_jobs(self) -> int:
         """Clear all data from the scraped_jobs table without deleting the table.
@@ -856,29 +977,36 @@ class JobDatabase:
         self._ensure_connection()
         
         try:
-            query = """
+            # Parsed and planned once per connection; default and custom thresholds share the plan
+            statement = """
             DELETE FROM scraped_jobs
             WHERE 
               (
                 min_amount != 0 
-                AND min_amount < %s 
-                AND max_amount < %s
+                AND min_amount < $1 
+                AND max_amount < $2
               )
               OR 
               (
-                min_amount >= %s 
-                AND max_amount < %s
+                min_amount >= $1 
+                AND max_amount < $2
               )
             """
             
             with self.conn.cursor() as cursor:
-                cursor.execute(query, (min_threshold, max_threshold, min_threshold, max_threshold))
+                self._prepare_statement(cursor, "delete_by_salary", "numeric, numeric", statement)
+                cursor.execute("EXECUTE delete_by_salary(%s, %s)", (min_threshold, max_threshold))
                 rows_deleted = cursor.rowcount
                 self.conn.commit()
                 
             logger.info(f"Deleted {rows_deleted} jobs with salaries below thresholds (min: {min_threshold}, max: {max_threshold})")
             return rows_deleted
         except Exception as e:
+            # Roll back so later work on this connection is not stuck in an aborted transaction.
+            # A successful PREPARE belongs to the session and survives the rollback, so the
+            # name stays in _prepared_statements
+            if not self.conn.closed:
+                self.conn.rollback()
             logger.error(f"Error deleting jobs by salary: {str(e)}")
             return 0
     
@@ -912,25 +1040,43 @@ class JobDatabase:
                 logger.error(f"Invalid field name: {field}")
                 return 0
                 
-            rows_deleted = 0
+            # Single scan: rows matching any pattern are deleted in one statement, and each row is
+            # attributed to the first matching pattern in file order (the same counts the old
+            # one-DELETE-per-pattern loop reported). unnest() yields the array in order, so LIMIT 1
+            # picks the earliest pattern.
+            patterns_lower = [pattern.lower() for pattern in patterns]
+            query = sql.SQL("""
+            WITH matched AS (
+                SELECT j.id,
+                       (SELECT p.ord
+                        FROM unnest(%(patterns)s::text[]) WITH ORDINALITY AS p(pat, ord)
+                        WHERE LOWER(j.{field}) LIKE p.pat
+                        LIMIT 1) AS ord
+                FROM scraped_jobs j
+                WHERE LOWER(j.{field}) LIKE ANY(%(patterns)s::text[])
+            ),
+            deleted AS (
+                DELETE FROM scraped_jobs s
+                USING matched m
+                WHERE s.id = m.id
+                RETURNING m.ord
+            )
+            SELECT ord, COUNT(*) FROM deleted GROUP BY ord
+            """).format(field=sql.Identifier(field))
             
             with self.conn.cursor() as cursor:
-                for pattern in patterns:
-                    # Convert pattern to lowercase for case-insensitive matching
-                    pattern_lower = pattern.lower()
-                    query = sql.SQL("DELETE FROM scraped_jobs WHERE LOWER({}) LIKE %s").format(
-                        sql.Identifier(field)
-                    )
-                    cursor.execute(query, (pattern_lower,))
-                    pattern_deleted = cursor.rowcount
-                    rows_deleted += pattern_deleted
-                    
-                    if pattern_deleted > 0:
-                        logger.info(f"Pattern '{pattern}' deleted {pattern_deleted} rows")
-                    else:
-                        logger.debug(f"Pattern '{pattern}' found no matches")
-                
+                cursor.execute(query, {'patterns': patterns_lower})
+                deleted_by_pattern = {ord_: count for ord_, count in cursor.fetchall()}
                 self.conn.commit()
+            
+            for ord_, pattern in enumerate(patterns, 1):
+                pattern_deleted = deleted_by_pattern.get(ord_, 0)
+                if pattern_deleted > 0:
+                    logger.info(f"Pattern '{pattern}' deleted {pattern_deleted} rows")
+                else:
+                    logger.debug(f"Pattern '{pattern}' found no matches")
+            
+            rows_deleted = sum(deleted_by_pattern.values())
                 
             logger.info(f"Deleted {rows_deleted} jobs matching {field} patterns from {patterns_file}")
             return rows_deleted
@@ -938,6 +1084,26 @@ class JobDatabase:
             logger.error(f"Error deleting jobs by {field}: {str(e)}")
             return 0
     
+    def export_table_to_csv(self, table: str, output_path: str) -> None:
+        """Stream a table to a CSV file using COPY TO STDOUT.
+        
+        Rows are written to disk as the server sends them, so the table is
+        never materialized in Python memory.
+        
+        Args:
+            table: Name of the table to export
+            output_path: Path of the CSV file to create
+        """
+        self._ensure_connection()
+        
+        copy_query = sql.SQL("COPY {} TO STDOUT WITH (FORMAT csv, HEADER)").format(
+            sql.Identifier(table)
+        )
+        
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            with self.conn.cursor() as cursor:
+                cursor.copy_expert(copy_query.as_string(self.conn), f)
+    
     def backup_and_reset(self) -> bool:
         """Create a backup of the database and clear all data.
         
@@ -956,15 +1122,13 @@ class JobDatabase:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
             # Backup scraped_jobs
-            jobs_df = self.get_all_jobs()
             jobs_backup_path = os.path.join(backup_dir, f"scraped_jobs_{timestamp}.csv")
-            jobs_df.to_csv(jobs_backup_path, index=False)
+            self.export_table_to_csv('scraped_jobs', jobs_backup_path)
             logger.info(f"Jobs CSV backup created at {jobs_backup_path}")
             
             # Backup search_history
-            search_df = pd.read_sql("SELECT * FROM search_history", self.conn)
             search_backup_path = os.path.join(backup_dir, f"search_history_{timestamp}.csv")
-            search_df.to_csv(search_backup_path, index=False)
+            self.export_table_to_csv('search_history', search_backup_path)
             logger.info(f"Search history CSV backup created at {search_backup_path}")
             
             # Clear all data
@@ -990,7 +1154,11 @@ class JobDatabase:
 
 
 class DuplicateManager:
-    """Class to handle duplicate job detection and management."""
+    """Class to handle duplicate job detection and management.
+    
+    Ranking of duplicates happens in the database (rank_duplicate_jobs), so only
+    job IDs cross the wire.
+    """
     
     def __init__(self, db: JobDatabase):
         """Initialize with database connection.
@@ -999,153 +1167,40 @@ class DuplicateManager:
             db: JobDatabase instance
         """
         self.db = db
-        self.site_preference = ['linkedin', 'indeed', 'google']
     
-    def identify_duplicates(self) -> Tuple[List[List[Dict]], List[str], List[str]]:
+    def identify_duplicates(self, since: Optional[datetime] = None) -> Tuple[int, List[str], List[str]]:
         """Identify duplicate jobs and determine which ones to keep/delete.
         
-        Returns:
-            Tuple of (duplicate_groups, ids_to_delete, ids_to_keep)
-        """
-        duplicate_groups = self.db.get_duplicate_groups()
-        ids_to_delete = []
-        ids_to_keep = []
-        
-        for group in duplicate_groups:
-            best_job = self._select_best_job(group)
-            ids_to_keep.append(best_job['id'])
-            
-            for job in group:
-                if job['id'] != best_job['id']:
-                    ids_to_delete.append(job['id'])
-        
-        return duplicate_groups, ids_to_delete, ids_to_keep
-    
-    def _select_best_job(self, jobs: List[Dict]) -> Dict:
-        """Select the best job from a group of duplicates using the ranking algorithm.
-        
         Args:
-            jobs: List of job dictionaries
-            
+            since: If provided, only consider groups touched by jobs scraped after this timestamp
+        
         Returns:
-            The best job dictionary
+            Tuple of (number of duplicate groups, ids_to_delete, ids_to_keep)
         """
-        candidates = jobs.copy()
-        
-        # Step 1: Filter by description (keep jobs with descriptions)
-        jobs_with_desc = [job for job in candidates if job.get('description') and job['description'].strip()]
-        if jobs_with_desc and len(jobs_with_desc) < len(candidates):
-            candidates = jobs_with_desc
-        
-        if len(candidates) == 1:
-            return candidates[0]
-        
-        # Step 2: Filter by Colorado location preference
-        colorado_jobs = [job for job in candidates 
-                        if job.get('location') and 
-                        (', CO' in job['location'] or 
-                         'Colorado' in job['location'] or
-                         ', co' in job['location'].lower() or
-                         'colorado' in job['location'].lower())]
-        if colorado_jobs and len(colorado_jobs) < len(candidates):
-            candidates = colorado_jobs
-        
-        if len(candidates) == 1:
-            return candidates[0]
-        
-        # Step 3: Filter by salary (keep jobs with min_amount > 0)
-        jobs_with_salary = [job for job in candidates 
-                           if job.get('min_amount') and job['min_amount'] > 0]
-        if jobs_with_salary and len(jobs_with_salary) < len(candidates):
-            candidates = jobs_with_salary
-        
-        if len(candidates) == 1:
-            return candidates[0]
-        
-        # Step 4: Select by highest min_amount
-        if len(candidates) > 1:
-            candidates_with_salary = [job for job in candidates 
-                                    if job.get('min_amount') and job['min_amount'] > 0]
-            if candidates_with_salary:
-                max_salary = max(job['min_amount'] for job in candidates_with_salary)
-                highest_salary_jobs = [job for job in candidates_with_salary 
-                                     if job['min_amount'] == max_salary]
-                if len(highest_salary_jobs) < len(candidates):
-                    candidates = highest_salary_jobs
-        
-        if len(candidates) == 1:
-            return candidates[0]
-        
-        # Step 5: Filter by remote status (if mixed, prefer remote=1)
-        remote_values = {job.get('is_remote', False) for job in candidates}
-        if False in remote_values and True in remote_values:
-            remote_jobs = [job for job in candidates if job.get('is_remote') == True]
-            if remote_jobs:
-                candidates = remote_jobs
-        
-        if len(candidates) == 1:
-            return candidates[0]
-        
-        # Step 6: Filter out United States search queries (prefer others)
-        non_us_jobs = [job for job in candidates 
-                      if not (job.get('search_query') and 
-                             'united states' in job['search_query'].lower())]
-        if non_us_jobs and len(non_us_jobs) < len(candidates):
-            candidates = non_us_jobs
-        
-        if len(candidates) == 1:
-            return candidates[0]
-        
-        # Step 7: Select by site preference
-        for preferred_site in self.site_preference:
-            site_jobs = [job for job in candidates if job.get('site', '').lower() == preferred_site]
-            if site_jobs:
-                candidates = site_jobs
-                break
-        
-        if len(candidates) == 1:
-            return candidates[0]
-        
-        # Step 8: Select by most recent date_posted
-        if len(candidates) > 1:
-            # Filter jobs that have valid dates
-            jobs_with_dates = [job for job in candidates 
-                             if job.get('date_posted') and job['date_posted'].strip()]
-            if jobs_with_dates:
-                # Sort by date_posted (assuming ISO format or comparable string format)
-                try:
-                    jobs_with_dates.sort(key=lambda x: x['date_posted'], reverse=True)
-                    return jobs_with_dates[0]
-                except:
-                    # If date sorting fails, continue to fallback
-                    pass
-        
-        # Fallback: return first job if no other criteria distinguishes them
-        return candidates[0]
+        rankings = self.db.get_duplicate_rankings(since)
+        ids_to_keep = [job_id for job_id, rank in rankings if rank == 1]
+        ids_to_delete = [job_id for job_id, rank in rankings if rank > 1]
+        
+        return len(ids_to_keep), ids_to_delete, ids_to_keep
     
-    def delete_duplicate_jobs_directly(self, ids_to_delete: List[str]) -> int:
-        """Delete duplicate jobs directly from database without creating files.
+    def delete_duplicate_jobs_directly(self, since: Optional[datetime] = None) -> int:
+        """Delete duplicate jobs server-side without creating files.
         
         Args:
-            ids_to_delete: List of job IDs to delete
+            since: If provided, only consider groups touched by jobs scraped after this timestamp
             
         Returns:
             Number of jobs deleted
         """
-        if not ids_to_delete:
-            return 0
+        self.db._ensure_connection()
+        
+        with self.db.conn.cursor() as cursor:
+            cursor.execute("CALL delete_duplicate_jobs(%s)", (since,))
+            rows_deleted = cursor.fetchone()[0]
+            self.db.conn.commit()
             
-        try:
-            with self.db.conn.cursor() as cursor:
-                cursor.execute("DELETE FROM scraped_jobs WHERE id = ANY(%s)", (ids_to_delete,))
-                rows_deleted = cursor.rowcount
-                self.db.conn.commit()
-                
-            logger.info(f"Deleted {rows_deleted} duplicate jobs directly")
-            return rows_deleted
-        except Exception as e:
-            logger.error(f"Error deleting duplicate jobs directly: {str(e)}")
-            return 0
+        logger.info(f"Deleted {rows_deleted} duplicate jobs directly")
+        return rows_deleted
     
     def create_delete_ids_file(self, ids_to_delete: List[str], filename: str = None) -> None:
         """Create/overwrite file with IDs to delete.
@@ -1368,22 +1423,21 @@ class JobScraper:
             logger.info("Working database scraping completed (no backup needed)")
     
     def _process_duplicates_auto(self) -> int:
-        """Process duplicates for auto-clean workflow (in-memory, no file creation).
+        """Process duplicates for auto-clean workflow (server-side, no file creation).
         
         Returns:
             Number of duplicate jobs deleted
         """
         try:
-            duplicate_groups, ids_to_delete, ids_to_keep = self.duplicate_manager.identify_duplicates()
+            # Groups without jobs scraped since the last cleanup were already resolved
+            scan_started = datetime.now()
+            watermark = self.db.get_dedup_watermark()
             
-            if not duplicate_groups:
-                logger.info("No duplicate groups found during auto-clean")
-                return 0
-            
-            # Delete duplicates directly without creating files
-            deleted_count = self.duplicate_manager.delete_duplicate_jobs_directly(ids_to_delete)
+            # Rank and delete in a single server-side call
+            deleted_count = self.duplicate_manager.delete_duplicate_jobs_directly(watermark)
+            self.db.set_dedup_watermark(scan_started)
             
-            logger.info(f"Auto-clean duplicate processing: {len(duplicate_groups)} groups, {deleted_count} duplicates removed")
+            logger.info(f"Auto-clean duplicate processing: {deleted_count} duplicates removed")
             return deleted_count
             
         except Exception as e:
@@ -1407,9 +1461,14 @@ class JobScraper:
             
         print("Processing duplicates...")
         
-        duplicate_groups, ids_to_delete, ids_to_keep = self.duplicate_manager.identify_duplicates()
+        # Deletions here are only proposed (delete_ids.txt), so the watermark is read but not advanced
+        watermark = self.db.get_dedup_watermark()
+        if watermark:
+            print(f"Scanning only jobs scraped since last duplicate cleanup ({watermark:%Y-%m-%d %H:%M:%S})")
         
-        if not duplicate_groups:
+        group_count, ids_to_delete, ids_to_keep = self.duplicate_manager.identify_duplicates(watermark)
+        
+        if not group_count:
             print("No duplicate groups found.")
             return
         
@@ -1417,7 +1476,7 @@ class JobScraper:
         self.duplicate_manager.create_delete_ids_file(ids_to_delete)
         
         print(f"\n=== PROCESSING SUMMARY ===")
-        print(f"Duplicate groups found: {len(duplicate_groups)}")
+        print(f"Duplicate groups found: {group_count}")
         print(f"IDs targeted for deletion: {len(ids_to_delete)}")
         print(f"IDs to keep (best from each group): {len(ids_to_keep)}")
         print(f"Delete IDs file: {os.path.join('configs', 'delete_ids.txt')}")
@@ -1807,6 +1866,117 @@ class JobScraper:
         self.db.close()
 
 
+def _file_arg(value: Optional[str]) -> Optional[str]:
+    """Map the CLI 'default' sentinel (or a missing value) to None so the default file is used."""
+    return None if value in (None, 'default') else value
+
+
+def _delete_by_salary_action(scraper: JobScraper, value: Optional[str]) -> None:
+    """Run salary deletion from a 'MIN,MAX' string, or the defaults for None/'default'.
+    
+    Raises:
+        ValueError: If the thresholds are not in MIN,MAX format
+    """
+    if value in (None, 'default'):
+        scraper.delete_jobs_by_salary()  # Use defaults: 70000, 90000
+    else:
+        min_sal, max_sal = map(int, str(value).split(','))
+        scraper.delete_jobs_by_salary(min_sal, max_sal)
+
+
+# Actions that can be chained in a --pipeline file: name -> callable(scraper, args)
+ACTIONS = {
+    'scrape': lambda scraper, value: scraper.run(),
+    'clear': lambda scraper, value: scraper.clear_jobs(),
+    'delete_before_date': lambda scraper, value: scraper.delete_jobs_before_date(value),
+    'delete_by_ids': lambda scraper, value: scraper.delete_jobs_by_ids(_file_arg(value)),
+    'delete_by_company': lambda scraper, value: scraper.delete_jobs_by_company(_file_arg(value)),
+    'delete_by_title': lambda scraper, value: scraper.delete_jobs_by_title(_file_arg(value)),
+    'delete_by_salary': _delete_by_salary_action,
+    'backup_reset': lambda scraper, value: scraper.backup_and_reset_db(),
+    'process_duplicates': lambda scraper, value: scraper.process_duplicates(),
+    'backup': lambda scraper, value: scraper.manual_backup(),
+    'cleanup_backups': lambda scraper, value: scraper.cleanup_backups(),
+}
+
+
+def _validate_step_args(action: str, value: Optional[str]) -> None:
+    """Check a pipeline step's args before any step runs.
+    
+    Args:
+        action: Name of the step's action
+        value: The step's args as a string, or None if it has none
+        
+    Raises:
+        ValueError: If the args are missing or malformed for the action
+    """
+    if action == 'delete_before_date':
+        if value is None:
+            raise ValueError("args must be a date in YYYY-MM-DD format")
+        try:
+            datetime.strptime(value, "%Y-%m-%d")
+        except ValueError:
+            raise ValueError(f"args must be a date in YYYY-MM-DD format, got '{value}'")
+    elif action == 'delete_by_salary':
+        if value not in (None, 'default'):
+            try:
+                min_sal, max_sal = map(int, value.split(','))
+            except ValueError:
+                raise ValueError(f"args must be 'default' or MIN,MAX salaries, got '{value}'")
+            if min_sal > max_sal:
+                raise ValueError(f"minimum salary {min_sal} is above maximum salary {max_sal}")
+    elif action in ('delete_by_ids', 'delete_by_company', 'delete_by_title'):
+        path = _file_arg(value)
+        if path is not None and not os.path.exists(path):
+            raise ValueError(f"file not found: {path}")
+
+
+def run_pipeline(scraper: JobScraper, pipeline_file) -> None:
+    """Run a sequence of actions from a YAML (or JSON) file in one process.
+    
+    The file holds a list of steps such as
+    ``[{action: delete_by_salary, args: default}, {action: process_duplicates}]``.
+    All steps share the scraper's database connection.
+    
+    Args:
+        scraper: JobScraper instance to run the actions against
+        pipeline_file: Open file object containing the pipeline definition
+    """
+    try:
+        steps = yaml.safe_load(pipeline_file) or []
+    except yaml.YAMLError as e:
+        logger.error(f"Could not parse pipeline file: {e}")
+        return
+    
+    if not isinstance(steps, list):
+        logger.error("Pipeline file must contain a list of steps")
+        return
+    
+    # Validate every step, args included, before running anything, so a bad step
+    # cannot stop the pipeline after earlier destructive steps have committed
+    plan = []
+    for i, step in enumerate(steps, 1):
+        if not isinstance(step, dict) or step.get('action') not in ACTIONS:
+            logger.error(f"Invalid pipeline step {i}: {step}. Valid actions: {', '.join(ACTIONS)}")
+            return
+        # YAML reads unquoted dates and numbers as objects; actions take strings
+        value = None if step.get('args') is None else str(step['args'])
+        try:
+            _validate_step_args(step['action'], value)
+        except ValueError as e:
+            logger.error(f"Invalid pipeline step {i} ({step['action']}): {e}")
+            return
+        plan.append((step['action'], value))
+    
+    for i, (action, value) in enumerate(plan, 1):
+        logger.info(f"Pipeline step {i}/{len(plan)}: {action}")
+        try:
+            ACTIONS[action](scraper, value)
+        except Exception as e:
+            logger.error(f"Pipeline step {i} ({action}) failed, stopping the pipeline: {e}")
+            return
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Job Scraper with PostgreSQL support and data management options")
@@ -1842,6 +2012,8 @@ def parse_args():
                              help='Test backup file integrity')
     action_group.add_argument('--cleanup-backups', action='store_true',
                              help='Force cleanup of old backups')
+    action_group.add_argument('--pipeline', metavar='FILE', type=argparse.FileType('r'),
+                             help=f'Run a YAML list of actions in one process (actions: {", ".join(ACTIONS)})')
     
     parser.add_argument('--config', metavar='FILE',
                        help=f'Path to job search configuration file (default: {os.path.join("configs", "job_search_config.json")})')
@@ -1885,6 +2057,9 @@ def main():
             scraper.cleanup_backups()
         elif args.create_working_copy:
             scraper.create_working_copy(auto_clean=not args.no_auto_clean)
+        elif args.pipeline:
+            with args.pipeline as pipeline_file:
+                run_pipeline(scraper, pipeline_file)
         elif args.scrape or not any([args.clear, args.delete_before_date, args.delete_by_ids is not None, 
                                   args.delete_by_company is not None, args.delete_by_title is not None, 
                                   args.delete_by_salary is not None, args.backup_reset, args.process_duplicates]):
@@ -1894,33 +2069,17 @@ def main():
         elif args.delete_before_date:
             scraper.delete_jobs_before_date(args.delete_before_date)
         elif args.delete_by_ids is not None:
-            if args.delete_by_ids == 'default':
-                ids_file = None  # Will use default
-            else:
-                ids_file = args.delete_by_ids
-            scraper.delete_jobs_by_ids(ids_file)
+            ACTIONS['delete_by_ids'](scraper, args.delete_by_ids)
         elif args.delete_by_company is not None:
-            if args.delete_by_company == 'default':
-                companies_file = None  # Will use default
-            else:
-                companies_file = args.delete_by_company
-            scraper.delete_jobs_by_company(companies_file)
+            ACTIONS['delete_by_company'](scraper, args.delete_by_company)
         elif args.delete_by_title is not None:
-            if args.delete_by_title == 'default':
-                titles_file = None  # Will use default
-            else:
-                titles_file = args.delete_by_title
-            scraper.delete_jobs_by_title(titles_file)
+            ACTIONS['delete_by_title'](scraper, args.delete_by_title)
         elif args.delete_by_salary is not None:
-            if args.delete_by_salary == 'default':
-                scraper.delete_jobs_by_salary()  # Use defaults: 70000, 90000
-            else:
-                try:
-                    min_sal, max_sal = map(int, args.delete_by_salary.split(','))
-                    scraper.delete_jobs_by_salary(min_sal, max_sal)
-                except ValueError:
-                    logger.error("Invalid salary format. Use: --delete-by-salary 70000,90000")
-                    sys.exit(1)
+            try:
+                ACTIONS['delete_by_salary'](scraper, args.delete_by_salary)
+            except ValueError:
+                logger.error("Invalid salary format. Use: --delete-by-salary 70000,90000")
+                sys.exit(1)
         elif args.backup_reset:
             scraper.backup_and_reset_db()
         elif args.process_duplicates:
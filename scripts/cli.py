@@ -3,31 +3,344 @@
 
 import typer
 import sqlite3
-import pandas as pd
 import json
+import csv
+import itertools
+from collections import deque
+from operator import itemgetter
 from datetime import datetime, timedelta
 import subprocess
 import os
-import rich
+import re
+import atexit
+import threading
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress
-from rich.markdown import Markdown
-from rich.syntax import Syntax
+from rich.text import Text
 from rich import box
-import plotext as plt
 from typing import List, Optional
 
+# orjson is optional; fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = typer.Typer(help="JobSpy CLI - Manage and analyze job postings")
 console = Console()
 
-def get_db_connection():
-    """Get a connection to the SQLite database"""
-    conn = sqlite3.connect("jobs.db")
-    conn.row_factory = sqlite3.Row
+# Rows fetched per round trip when streaming exports
+EXPORT_CHUNK_SIZE = 10_000
+
+# Per-thread SQLite connection, see get_db_connection
+_tls = threading.local()
+
+# Parsed config files keyed by path, as (mtime, config)
+_config_cache = {}
+
+# Lines of scraper output kept for the panel shown after `run`
+SCRAPER_OUTPUT_TAIL = 200
+
+# Order of the `list` table columns
+LIST_DISPLAY_COLUMNS = ["id", "title", "company", "location", "salary_display", "date_posted", "site"]
+
+# Rows of the `view` info table as (label, column)
+VIEW_INFO_FIELDS = [
+    ("Company", "company"),
+    ("Location", "location"),
+    ("Posted", "date_posted"),
+    ("Job Type", "job_type"),
+    ("Remote", "is_remote"),
+    ("Salary", "salary_display"),
+    ("Site", "site"),
+    ("Job URL", "job_url"),
+    ("Direct Apply URL", "job_url_direct"),
+    ("Company URL", "company_url"),
+]
+
+# Descriptions shorter than this (and free of markdown syntax) are printed as plain text
+PLAIN_DESCRIPTION_LIMIT = 2048
+MARKDOWN_SYNTAX = re.compile(r"[#*_`\[\]>|]|^\s*(?:[-+]|\d+\.)\s", re.MULTILINE)
+
+# Cached result of id_is_integer
+_id_is_integer = None
+
+# `list` SQL templates keyed by which filters are in use
+_list_query_cache = {}
+
+# Columns shown by `list` (description is added only with --description)
+LIST_COLUMNS = ["id", "title", "company", "location", "date_posted", "site"]
+
+# Connection tuning for the read-heavy commands: WAL, 64 MB page cache, 256 MB mmap
+SQLITE_PRAGMAS = [
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+]
+
+# Indexes backing the list/search/stats/export filters, created on first connection
+SQLITE_INDEXES = {
+    "idx_date_posted": "CREATE INDEX IF NOT EXISTS idx_date_posted ON scraped_jobs (date_posted DESC)",
+    "idx_site_date": "CREATE INDEX IF NOT EXISTS idx_site_date ON scraped_jobs (site, date_posted DESC)",
+    "idx_query_date": "CREATE INDEX IF NOT EXISTS idx_query_date ON scraped_jobs (search_query, date_posted DESC)",
+    "idx_remote": "CREATE INDEX IF NOT EXISTS idx_remote ON scraped_jobs (is_remote)",
+    "idx_job_type": "CREATE INDEX IF NOT EXISTS idx_job_type ON scraped_jobs (job_type)",
+    "idx_listing": "CREATE INDEX IF NOT EXISTS idx_listing ON scraped_jobs (site, search_query, date_posted DESC)",
+}
+
+# Self-contained FTS5 index over title/description, kept in sync by triggers.
+# scraped_jobs.id is TEXT and its implicit rowid can be renumbered by VACUUM, so the
+# index stores id itself and jobs_fts_ids maps each id to its (stable) FTS rowid.
+# The DROPs replace the earlier rowid-keyed external-content index.
+JOBS_FTS_SQL = """
+    BEGIN;
+    DROP TRIGGER IF EXISTS jobs_ai;
+    DROP TRIGGER IF EXISTS jobs_ad;
+    DROP TRIGGER IF EXISTS jobs_au;
+    DROP TABLE IF EXISTS jobs_fts;
+    CREATE VIRTUAL TABLE jobs_fts USING fts5(
+        id UNINDEXED, title, description, tokenize='porter unicode61'
+    );
+    CREATE TABLE jobs_fts_ids (id TEXT PRIMARY KEY, fts_rowid INTEGER NOT NULL) WITHOUT ROWID;
+    CREATE TRIGGER jobs_ai AFTER INSERT ON scraped_jobs WHEN new.id IS NOT NULL BEGIN
+        INSERT INTO jobs_fts (id, title, description) VALUES (new.id, new.title, new.description);
+        INSERT INTO jobs_fts_ids (id, fts_rowid) VALUES (new.id, last_insert_rowid());
+    END;
+    CREATE TRIGGER jobs_ad AFTER DELETE ON scraped_jobs WHEN old.id IS NOT NULL BEGIN
+        DELETE FROM jobs_fts WHERE rowid = (SELECT fts_rowid FROM jobs_fts_ids WHERE id = old.id);
+        DELETE FROM jobs_fts_ids WHERE id = old.id;
+    END;
+    CREATE TRIGGER jobs_au AFTER UPDATE OF id, title, description ON scraped_jobs BEGIN
+        DELETE FROM jobs_fts WHERE rowid = (SELECT fts_rowid FROM jobs_fts_ids WHERE id = old.id);
+        DELETE FROM jobs_fts_ids WHERE id = old.id;
+        INSERT INTO jobs_fts (id, title, description)
+            SELECT new.id, new.title, new.description WHERE new.id IS NOT NULL;
+        INSERT INTO jobs_fts_ids (id, fts_rowid)
+            SELECT new.id, last_insert_rowid() WHERE new.id IS NOT NULL;
+    END;
+    INSERT INTO jobs_fts (id, title, description)
+        SELECT id, title, description FROM scraped_jobs WHERE id IS NOT NULL;
+    INSERT INTO jobs_fts_ids (id, fts_rowid) SELECT id, rowid FROM jobs_fts;
+    COMMIT;
+"""
+
+# Exact scraped_jobs row count kept current by triggers, so stats needn't COUNT(*)
+ROW_COUNTER_SQL = """
+    BEGIN;
+    CREATE TABLE _counts (name TEXT PRIMARY KEY, n INTEGER NOT NULL);
+    CREATE TRIGGER scraped_jobs_count_ai AFTER INSERT ON scraped_jobs BEGIN
+        UPDATE _counts SET n = n + 1 WHERE name = 'scraped_jobs';
+    END;
+    CREATE TRIGGER scraped_jobs_count_ad AFTER DELETE ON scraped_jobs BEGIN
+        UPDATE _counts SET n = n - 1 WHERE name = 'scraped_jobs';
+    END;
+    INSERT INTO _counts (name, n) SELECT 'scraped_jobs', COUNT(*) FROM scraped_jobs;
+    COMMIT;
+"""
+
+# All `stats` aggregates as one UNION ALL over a single scan of scraped_jobs.
+# Rows are (section, group value, count, percentage of all jobs, metric1, metric2, metric3);
+# percentages come from a SUM(COUNT(*)) OVER () window over each grouping.
+STATS_SQL = """
+    WITH j AS MATERIALIZED (
+        SELECT site, search_query, job_type, is_remote, min_amount, max_amount, interval,
+               (description IS NOT NULL AND description != '') AS has_desc
+        FROM scraped_jobs
+    )
+    SELECT 'total', NULL, n, NULL, NULL, NULL, NULL FROM _counts WHERE name = 'scraped_jobs'
+    UNION ALL
+    SELECT 'site', site, COUNT(*), 100.0 * COUNT(*) / SUM(COUNT(*)) OVER (),
+        SUM(has_desc), ROUND(100.0 * SUM(has_desc) / COUNT(*), 2), NULL
+    FROM j GROUP BY site
+    UNION ALL
+    SELECT 'query', search_query, COUNT(*), 100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), NULL, NULL, NULL
+    FROM j GROUP BY search_query
+    UNION ALL
+    SELECT 'remote', is_remote, COUNT(*), 100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), NULL, NULL, NULL
+    FROM j GROUP BY is_remote
+    UNION ALL
+    -- Percentages are of all jobs, so filter out NULL types after the window sum
+    SELECT 'type', job_type, cnt, pct, NULL, NULL, NULL FROM (
+        SELECT job_type, COUNT(*) AS cnt, 100.0 * COUNT(*) / SUM(COUNT(*)) OVER () AS pct
+        FROM j GROUP BY job_type
+    ) WHERE job_type IS NOT NULL
+    UNION ALL
+    SELECT 'salary', NULL, COUNT(*), NULL,
+        AVG(CASE WHEN min_amount > 0 AND max_amount > 0
+            THEN (min_amount + max_amount) / 2
+            WHEN min_amount > 0 THEN min_amount
+            WHEN max_amount > 0 THEN max_amount
+            ELSE 0 END),
+        MAX(max_amount),
+        MIN(CASE WHEN min_amount > 0 THEN min_amount ELSE NULL END)
+    FROM j WHERE interval = 'yearly'
+"""
+
+def format_salary(min_amount, max_amount, currency, interval):
+    """Format a salary range for display, e.g. "80,000 - 100,000 USD (yearly)"
+    
+    Registered as the salary_display() SQL function so list and view can
+    project it; rounding is Python's (half to even), as before.
+    """
+    if min_amount and max_amount:
+        return f"{min_amount:,.0f} - {max_amount:,.0f} {currency or ''} ({interval or ''})"
+    if min_amount:
+        return f"{min_amount:,.0f}+ {currency or ''} ({interval or ''})"
+    if max_amount:
+        return f"Up to {max_amount:,.0f} {currency or ''} ({interval or ''})"
+    return ""
+
+# Salary display string, formatted by format_salary() above
+SALARY_DISPLAY_SQL = "salary_display(min_amount, max_amount, currency, interval)"
+
+def json_dumps(obj):
+    """Serialize obj to a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+def json_loads(text):
+    """Parse a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def write_json_records(output_path, columns, batches):
+    """Write row batches to a JSON array of records, one object per line
+    
+    Args:
+        output_path: File to write
+        columns: Column names; any extra trailing values in a row are dropped
+        batches: Iterable of lists of rows
+    
+    Returns:
+        Number of records written
+    """
+    written = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for batch in batches:
+            for row in batch:
+                f.write(",\n    " if written else "\n    ")
+                f.write(json_dumps(dict(zip(columns, row))))
+                written += 1
+        f.write("\n]\n")
+    return written
+
+def table_exists(conn, name):
+    """Check whether a table (or virtual table) exists in the database"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone()
+    return row is not None
+
+def ensure_indexes(conn):
+    """Create the indexes used by list/search/stats filters, running ANALYZE when any are new"""
+    has_jobs_table = table_exists(conn, "scraped_jobs")
+    if not has_jobs_table:
+        return
+    
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    missing = [ddl for name, ddl in SQLITE_INDEXES.items() if name not in existing]
+    if not missing:
+        return
+    
+    for ddl in missing:
+        conn.execute(ddl)
+    conn.execute("ANALYZE")
+    conn.commit()
+
+def ensure_search_index(conn):
+    """Create and populate the jobs_fts full-text index if it does not exist yet"""
+    if table_exists(conn, "jobs_fts_ids") or not table_exists(conn, "scraped_jobs"):
+        return
+    
+    try:
+        conn.executescript(JOBS_FTS_SQL)
+    except sqlite3.OperationalError as e:
+        conn.rollback()
+        # SQLite built without FTS5: search falls back to LIKE
+        console.print(f"[yellow]Full-text index unavailable: {str(e)}[/yellow]")
+
+def ensure_row_counter(conn):
+    """Create the trigger-maintained scraped_jobs row count if it does not exist yet"""
+    if table_exists(conn, "_counts") or not table_exists(conn, "scraped_jobs"):
+        return
+    
+    conn.executescript(ROW_COUNTER_SQL)
+
+def get_db_connection(read_only: bool = False):
+    """Get this thread's shared connection to the SQLite database
+    
+    The connection is opened (and the pragmas, indexes, FTS table and row counter
+    set up) once per thread, then reused by every later command.
+    
+    Args:
+        read_only: Set PRAGMA query_only for this command
+    """
+    conn = getattr(_tls, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect("jobs.db", check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.create_function("salary_display", 4, format_salary, deterministic=True)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        ensure_indexes(conn)
+        ensure_search_index(conn)
+        ensure_row_counter(conn)
+        atexit.register(conn.close)
+        _tls.conn = conn
+    conn.execute(f"PRAGMA query_only = {'ON' if read_only else 'OFF'}")
     return conn
 
+def like_contains(text):
+    """Build a LIKE pattern matching text anywhere, with %, _ and \\ in text taken literally"""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+def build_list_query(export, show_description, query, site, job_type, remote, title, company, min_salary, days, limit):
+    """Build the `list` SQL for a combination of filters
+    
+    Each argument says whether that option is in use; values are bound as
+    parameters in the same order the filters are added here.
+    
+    Returns:
+        SQL string with one placeholder per active filter (and LIMIT)
+    """
+    # Project only displayed columns unless exporting, with the formatted salary
+    if export:
+        select_cols = "*"
+    else:
+        select_cols = ", ".join(LIST_COLUMNS + (["description"] if show_description else []))
+    query_str = f"SELECT {select_cols}, {SALARY_DISPLAY_SQL} AS salary_display FROM scraped_jobs WHERE 1=1"
+    
+    if query:
+        query_str += " AND search_query = ?"
+    if site:
+        query_str += " AND site = ?"
+    if job_type:
+        query_str += " AND job_type = ?"
+    if remote:
+        query_str += " AND is_remote = 1"
+    if title:
+        query_str += " AND title LIKE ? ESCAPE '\\'"
+    if company:
+        query_str += " AND company LIKE ? ESCAPE '\\'"
+    if min_salary:
+        query_str += " AND (min_amount >= ? OR max_amount >= ?)"
+    if days:
+        query_str += " AND date_posted >= ?"
+    
+    query_str += " ORDER BY date_posted DESC"
+    
+    if limit:
+        query_str += " LIMIT ?"
+    
+    return query_str
+
 @app.command("list")
 def list_jobs(
     query: Optional[str] = typer.Option(None, "--query", "-q", help="Filter by search query"),
@@ -43,418 +356,356 @@ def list_jobs(
     show_description: bool = typer.Option(False, "--description", help="Show job descriptions")
 ):
     """List job postings with filters"""
-    with get_db_connection() as conn:
-        # Build query
-        query_str = "SELECT * FROM scraped_jobs WHERE 1=1"
-        params = []
-        
-        if query:
-            query_str += " AND search_query = ?"
-            params.append(query)
-        
-        if site:
-            query_str += " AND site = ?"
-            params.append(site)
-        
-        if job_type:
-            query_str += " AND job_type = ?"
-            params.append(job_type)
+    conn = get_db_connection(read_only=True)
+    # Reuse the SQL template for this combination of filters; only the params vary
+    query_key = (
+        bool(export), show_description, bool(query), bool(site), bool(job_type),
+        remote, bool(title), bool(company), bool(min_salary), bool(days), bool(limit)
+    )
+    query_str = _list_query_cache.get(query_key)
+    if query_str is None:
+        query_str = build_list_query(*query_key)
+        _list_query_cache[query_key] = query_str
+    
+    params = []
+    if query:
+        params.append(query)
+    if site:
+        params.append(site)
+    if job_type:
+        params.append(job_type)
+    if title:
+        params.append(like_contains(title))
+    if company:
+        params.append(like_contains(company))
+    if min_salary:
+        params.extend([min_salary, min_salary])
+    if days:
+        params.append((datetime.now() - timedelta(days=days)).isoformat())
+    if limit:
+        params.append(limit)
+    
+    # Execute query
+    try:
+        cursor = conn.execute(query_str, params)
+        rows = cursor.fetchall()
         
-        if remote:
-            query_str += " AND is_remote = 1"
+        if not rows:
+            console.print("[bold red]No jobs found matching your criteria[/bold red]")
+            return
         
-        if title:
-            query_str += " AND title LIKE ?"
-            params.append(f"%{title}%")
+        # Export if requested (the only place a DataFrame is needed)
+        if export:
+            # salary_display is the last column and is left out of exports
+            all_columns = [d[0] for d in cursor.description]
+            columns = all_columns[:-1]
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"jobspy_export_{timestamp}"
+            
+            if export.lower() == "csv":
+                import pandas as pd
+                export_path = f"{filename}.csv"
+                df = pd.DataFrame.from_records(rows, columns=all_columns, exclude=["salary_display"])
+                df.to_csv(export_path, index=False)
+            elif export.lower() == "excel":
+                import pandas as pd
+                export_path = f"{filename}.xlsx"
+                df = pd.DataFrame.from_records(rows, columns=all_columns, exclude=["salary_display"])
+                df.to_excel(export_path, index=False)
+            elif export.lower() == "json":
+                export_path = f"{filename}.json"
+                write_json_records(export_path, columns, [rows])
+            else:
+                console.print(f"[bold red]Invalid export format: {export}[/bold red]")
+                return
+            
+            console.print(f"[bold green]Exported {len(rows)} jobs to {export_path}[/bold green]")
         
-        if company:
-            query_str += " AND company LIKE ?"
-            params.append(f"%{company}%")
+        # Display results
+        table = Table(
+            title=f"Job Listings ({len(rows)} results)",
+            box=box.ROUNDED,
+            show_lines=True
+        )
         
-        if min_salary:
-            query_str += " AND (min_amount >= ? OR max_amount >= ?)"
-            params.extend([min_salary, min_salary])
+        # Table columns
+        table.add_column("ID", style="dim")
+        table.add_column("Title", style="bold cyan")
+        table.add_column("Company", style="green")
+        table.add_column("Location", style="blue")
+        table.add_column("Salary", style="yellow")
+        table.add_column("Posted", style="magenta")
+        table.add_column("Site", style="red")
         
-        if days:
-            date_limit = (datetime.now() - timedelta(days=days)).isoformat()
-            query_str += " AND date_posted >= ?"
-            params.append(date_limit)
+        # Add rows, picking the displayed columns by position (resolved once)
+        columns = [d[0] for d in cursor.description]
+        display_values = itemgetter(*(columns.index(c) for c in LIST_DISPLAY_COLUMNS))
+        for row in rows:
+            table.add_row(*map(str, display_values(row)))
         
-        query_str += " ORDER BY date_posted DESC"
+        console.print(table)
         
-        if limit:
-            query_str += f" LIMIT {limit}"
+        # Show descriptions if requested
+        if show_description:
+            from rich.markdown import Markdown
+            for row in rows:
+                if row["description"]:
+                    console.print(f"\n[bold cyan]{row['title']} at {row['company']}[/bold cyan]")
+                    console.print(Panel(
+                        Markdown(row["description"]),
+                        title="Job Description",
+                        width=100
+                    ))
+                    console.print("\n" + "-" * 100 + "\n")
         
-        # Execute query
-        try:
-            df = pd.read_sql_query(query_str, conn, params=params)
-            
-            if len(df) == 0:
-                console.print("[bold red]No jobs found matching your criteria[/bold red]")
-                return
-            
-            # Export if requested
-            if export:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"jobspy_export_{timestamp}"
-                
-                if export.lower() == "csv":
-                    export_path = f"{filename}.csv"
-                    df.to_csv(export_path, index=False)
-                elif export.lower() == "excel":
-                    export_path = f"{filename}.xlsx"
-                    df.to_excel(export_path, index=False)
-                elif export.lower() == "json":
-                    export_path = f"{filename}.json"
-                    df.to_json(export_path, orient="records", indent=4)
-                else:
-                    console.print(f"[bold red]Invalid export format: {export}[/bold red]")
-                    return
-                
-                console.print(f"[bold green]Exported {len(df)} jobs to {export_path}[/bold green]")
-            
-            # Display results
-            table = Table(
-                title=f"Job Listings ({len(df)} results)",
-                box=box.ROUNDED,
-                show_lines=True
-            )
-            
-            # Table columns
-            table.add_column("ID", style="dim")
-            table.add_column("Title", style="bold cyan")
-            table.add_column("Company", style="green")
-            table.add_column("Location", style="blue")
-            table.add_column("Salary", style="yellow")
-            table.add_column("Posted", style="magenta")
-            table.add_column("Site", style="red")
-            
-            # Add rows
-            for _, row in df.iterrows():
-                # Format salary
-                salary = ""
-                if row.get("min_amount") and row.get("max_amount"):
-                    salary = f"{row['min_amount']:,.0f} - {row['max_amount']:,.0f} {row.get('currency', '')} ({row.get('interval', '')})"
-                elif row.get("min_amount"):
-                    salary = f"{row['min_amount']:,.0f}+ {row.get('currency', '')} ({row.get('interval', '')})"
-                elif row.get("max_amount"):
-                    salary = f"Up to {row['max_amount']:,.0f} {row.get('currency', '')} ({row.get('interval', '')})"
-                
-                table.add_row(
-                    str(row.get("id", "")),
-                    str(row.get("title", "")),
-                    str(row.get("company", "")),
-                    str(row.get("location", "")),
-                    salary,
-                    str(row.get("date_posted", "")),
-                    str(row.get("site", ""))
-                )
-            
-            console.print(table)
-            
-            # Show descriptions if requested
-            if show_description:
-                for _, row in df.iterrows():
-                    if row.get("description"):
-                        console.print(f"\n[bold cyan]{row.get('title')} at {row.get('company')}[/bold cyan]")
-                        console.print(Panel(
-                            Markdown(row.get("description", "No description available")),
-                            title="Job Description",
-                            width=100
-                        ))
-                        console.print("\n" + "-" * 100 + "\n")
-            
-        except sqlite3.Error as e:
-            console.print(f"[bold red]Database error: {str(e)}[/bold red]")
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Database error: {str(e)}[/bold red]")
+
+def count_table(label, counts):
+    """Build a Count/Percentage table from (name, count, percentage) rows
+    
+    Args:
+        label: Header for the name column
+        counts: List of (name, count, percentage) tuples
+    
+    Returns:
+        Rich Table
+    """
+    table = Table(box=box.SIMPLE)
+    table.add_column(label, style="cyan")
+    table.add_column("Count", style="green")
+    table.add_column("Percentage", style="yellow")
+    
+    for name, count, percentage in counts:
+        table.add_row(name, str(count), f"{percentage:.1f}%")
+    
+    return table
 
 @app.command("stats")
 def show_stats():
     """Show job statistics and analytics"""
-    with get_db_connection() as conn:
-        try:
-            # Get total jobs
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) as count FROM scraped_jobs")
-            total_jobs = cursor.fetchone()["count"]
-            
-            # Get jobs by site
-            cursor.execute(
-                "SELECT site, COUNT(*) as count FROM scraped_jobs GROUP BY site ORDER BY count DESC"
-            )
-            site_counts = cursor.fetchall()
-            
-            # Get jobs by search query
-            cursor.execute(
-                "SELECT search_query, COUNT(*) as count FROM scraped_jobs GROUP BY search_query ORDER BY count DESC"
-            )
-            query_counts = cursor.fetchall()
-            
-            # Get salary stats
-            cursor.execute(
-                """
-                SELECT 
-                    AVG(CASE WHEN min_amount > 0 AND max_amount > 0 
-                        THEN (min_amount + max_amount) / 2 
-                        WHEN min_amount > 0 THEN min_amount 
-                        WHEN max_amount > 0 THEN max_amount 
-                        ELSE 0 END) as avg_salary,
-                    MAX(max_amount) as max_salary,
-                    MIN(CASE WHEN min_amount > 0 THEN min_amount ELSE NULL END) as min_salary
-                FROM scraped_jobs
-                WHERE interval = 'yearly'
-                """
-            )
-            salary_stats = cursor.fetchone()
-            
-            # Get remote vs on-site
-            cursor.execute(
-                "SELECT is_remote, COUNT(*) as count FROM scraped_jobs GROUP BY is_remote"
-            )
-            remote_stats = {row["is_remote"]: row["count"] for row in cursor.fetchall()}
-            
-            # Get job types
-            cursor.execute(
-                """
-                SELECT job_type, COUNT(*) as count 
-                FROM scraped_jobs 
-                WHERE job_type IS NOT NULL
-                GROUP BY job_type 
-                ORDER BY count DESC
-                """
-            )
-            job_type_stats = cursor.fetchall()
-            
-            # Display statistics
-            console.print("\n[bold]JobSpy Statistics[/bold]")
-            console.print(f"Total jobs: [bold cyan]{total_jobs}[/bold cyan]")
-            console.print(f"Remote jobs: [bold green]{remote_stats.get(1, 0)}[/bold green] ({remote_stats.get(1, 0)/total_jobs*100:.1f}%)")
-            console.print(f"On-site jobs: [bold yellow]{remote_stats.get(0, 0)}[/bold yellow] ({remote_stats.get(0, 0)/total_jobs*100:.1f}%)")
-            
-            # Salary stats
-            console.print("\n[bold]Salary Statistics (Yearly)[/bold]")
-            if salary_stats["avg_salary"]:
-                console.print(f"Average salary: [bold green]${salary_stats['avg_salary']:,.2f}[/bold green]")
-                console.print(f"Minimum salary: [bold blue]${salary_stats['min_salary']:,.2f}[/bold blue]")
-                console.print(f"Maximum salary: [bold yellow]${salary_stats['max_salary']:,.2f}[/bold yellow]")
-            else:
-                console.print("[yellow]No salary data available[/yellow]")
-            
-            # Jobs by site
-            console.print("\n[bold]Jobs by Site[/bold]")
-            site_table = Table(box=box.SIMPLE)
-            site_table.add_column("Site", style="cyan")
-            site_table.add_column("Count", style="green")
-            site_table.add_column("Percentage", style="yellow")
-            
-            # Terminal chart for sites
-            site_names = []
-            site_values = []
-            
-            for site in site_counts:
-                percentage = site["count"] / total_jobs * 100
-                site_table.add_row(
-                    site["site"],
-                    str(site["count"]),
-                    f"{percentage:.1f}%"
-                )
-                site_names.append(site["site"])
-                site_values.append(site["count"])
-            
-            console.print(site_table)
-            
-            # Plot bar chart in terminal
-            plt.clear_data()
-            plt.bar(site_names, site_values, orientation="horizontal")
-            plt.title("Jobs by Site")
-            plt.show()
-            
-            # Jobs by search query
-            console.print("\n[bold]Jobs by Search Query[/bold]")
-            query_table = Table(box=box.SIMPLE)
-            query_table.add_column("Search Query", style="cyan")
-            query_table.add_column("Count", style="green")
-            query_table.add_column("Percentage", style="yellow")
-            
-            for query in query_counts:
-                percentage = query["count"] / total_jobs * 100
-                query_table.add_row(
-                    query["search_query"],
-                    str(query["count"]),
-                    f"{percentage:.1f}%"
-                )
-            
-            console.print(query_table)
-            
-            # Jobs by type
-            console.print("\n[bold]Jobs by Type[/bold]")
-            type_table = Table(box=box.SIMPLE)
-            type_table.add_column("Job Type", style="cyan")
-            type_table.add_column("Count", style="green")
-            type_table.add_column("Percentage", style="yellow")
-            
-            for job_type in job_type_stats:
-                percentage = job_type["count"] / total_jobs * 100
-                type_table.add_row(
-                    job_type["job_type"] or "Not specified",
-                    str(job_type["count"]),
-                    f"{percentage:.1f}%"
-                )
-            
-            console.print(type_table)
-            
-            # Get description coverage by site
-            cursor.execute(
-                """
-                SELECT 
-                    site,
-                    COUNT(*) as total_jobs,
-                    COUNT(CASE WHEN description IS NOT NULL AND description != '' THEN 1 END) as jobs_with_desc,
-                    ROUND(
-                        (COUNT(CASE WHEN description IS NOT NULL AND description != '' THEN 1 END) * 100.0) / COUNT(*), 
-                        2
-                    ) as description_percentage
-                FROM scraped_jobs 
-                GROUP BY site 
-                ORDER BY description_percentage DESC
-                """
+    import plotext as plt
+    conn = get_db_connection(read_only=True)
+    try:
+        # Gather every aggregate in one pass: each row is tagged with the
+        # section it belongs to (k), its group value (g), count, percentage and up to three metrics
+        cursor = conn.cursor()
+        cursor.execute(STATS_SQL)
+        
+        total_jobs = 0
+        site_counts = []
+        query_counts = []
+        remote_stats = {}
+        job_type_stats = []
+        description_coverage = []
+        salary_stats = {"avg_salary": None, "max_salary": None, "min_salary": None}
+        
+        for k, g, n, pct, x1, x2, x3 in cursor.fetchall():
+            if k == "total":
+                total_jobs = n
+            elif k == "site":
+                site_counts.append((g, n, pct))
+                description_coverage.append({
+                    "site": g,
+                    "total_jobs": n,
+                    "jobs_with_desc": x1,
+                    "description_percentage": x2,
+                })
+            elif k == "query":
+                query_counts.append((g, n, pct))
+            elif k == "remote":
+                remote_stats[g] = (n, pct)
+            elif k == "type":
+                job_type_stats.append((g or "Not specified", n, pct))
+            elif k == "salary":
+                salary_stats = {"avg_salary": x1, "max_salary": x2, "min_salary": x3}
+        
+        site_counts.sort(key=lambda row: row[1], reverse=True)
+        query_counts.sort(key=lambda row: row[1], reverse=True)
+        job_type_stats.sort(key=lambda row: row[1], reverse=True)
+        description_coverage.sort(key=lambda row: row["description_percentage"], reverse=True)
+        remote_count, remote_pct = remote_stats.get(1, (0, 0.0))
+        onsite_count, onsite_pct = remote_stats.get(0, (0, 0.0))
+        
+        # Display statistics
+        console.print("\n[bold]JobSpy Statistics[/bold]")
+        console.print(f"Total jobs: [bold cyan]{total_jobs}[/bold cyan]")
+        console.print(f"Remote jobs: [bold green]{remote_count}[/bold green] ({remote_pct:.1f}%)")
+        console.print(f"On-site jobs: [bold yellow]{onsite_count}[/bold yellow] ({onsite_pct:.1f}%)")
+        
+        # Salary stats
+        console.print("\n[bold]Salary Statistics (Yearly)[/bold]")
+        if salary_stats["avg_salary"]:
+            console.print(f"Average salary: [bold green]${salary_stats['avg_salary']:,.2f}[/bold green]")
+            console.print(f"Minimum salary: [bold blue]${salary_stats['min_salary']:,.2f}[/bold blue]")
+            console.print(f"Maximum salary: [bold yellow]${salary_stats['max_salary']:,.2f}[/bold yellow]")
+        else:
+            console.print("[yellow]No salary data available[/yellow]")
+        
+        # Jobs by site
+        console.print("\n[bold]Jobs by Site[/bold]")
+        console.print(count_table("Site", site_counts))
+        
+        # Plot bar chart in terminal
+        plt.clear_data()
+        plt.bar([name for name, _, _ in site_counts], [count for _, count, _ in site_counts], orientation="horizontal")
+        plt.title("Jobs by Site")
+        plt.show()
+        
+        # Jobs by search query
+        console.print("\n[bold]Jobs by Search Query[/bold]")
+        console.print(count_table("Search Query", query_counts))
+        
+        # Jobs by type
+        console.print("\n[bold]Jobs by Type[/bold]")
+        console.print(count_table("Job Type", job_type_stats))
+        
+        # Add this display section after the salary statistics section:
+        
+        # Description coverage by site
+        console.print("\n[bold]Description Coverage by Site[/bold]")
+        desc_table = Table(box=box.ROUNDED)
+        desc_table.add_column("Site", style="cyan")
+        desc_table.add_column("Total Jobs", style="blue")
+        desc_table.add_column("With Description", style="green")
+        desc_table.add_column("Coverage %", style="yellow")
+        
+        for row in description_coverage:
+            desc_table.add_row(
+                row["site"],
+                str(row["total_jobs"]),
+                str(row["jobs_with_desc"]),
+                f"{row['description_percentage']:.1f}%"
             )
-            description_coverage = cursor.fetchall()
-            
-            # Add this display section after the salary statistics section:
-            
-            # Description coverage by site
-            console.print("\n[bold]Description Coverage by Site[/bold]")
-            desc_table = Table(box=box.ROUNDED)
-            desc_table.add_column("Site", style="cyan")
-            desc_table.add_column("Total Jobs", style="blue")
-            desc_table.add_column("With Description", style="green")
-            desc_table.add_column("Coverage %", style="yellow")
-            
-            for row in description_coverage:
-                desc_table.add_row(
-                    row["site"],
-                    str(row["total_jobs"]),
-                    str(row["jobs_with_desc"]),
-                    f"{row['description_percentage']:.1f}%"
-                )
-            
-            console.print(desc_table)
-            
-        except sqlite3.Error as e:
-            console.print(f"[bold red]Database error: {str(e)}[/bold red]")
+        
+        console.print(desc_table)
+        
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Database error: {str(e)}[/bold red]")
+
+def id_is_integer(conn):
+    """Check (once per process) whether scraped_jobs.id is an INTEGER column"""
+    global _id_is_integer
+    if _id_is_integer is None:
+        id_types = [row["type"] for row in conn.execute("PRAGMA table_info(scraped_jobs)") if row["name"] == "id"]
+        _id_is_integer = bool(id_types) and id_types[0].upper() == "INTEGER"
+    return _id_is_integer
 
 @app.command("view")
 def view_job(job_id: str = typer.Argument(..., help="Job ID to view")):
     """View detailed information about a specific job"""
-    with get_db_connection() as conn:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM scraped_jobs WHERE id = ?", (job_id,))
-            job = cursor.fetchone()
-            
-            if not job:
-                console.print(f"[bold red]Job with ID {job_id} not found[/bold red]")
-                return
-            
-            # Display job details
-            console.print(f"\n[bold cyan]{job['title']} at {job['company']}[/bold cyan]")
-            
-            # Basic info
-            info_table = Table(box=box.SIMPLE)
-            info_table.add_column("Field", style="bold blue")
-            info_table.add_column("Value", style="green")
-            
-            info_table.add_row("Company", job["company"] or "")
-            info_table.add_row("Location", job["location"] or "")
-            info_table.add_row("Posted", job["date_posted"] or "")
-            info_table.add_row("Job Type", job["job_type"] or "")
-            info_table.add_row("Remote", "Yes" if job["is_remote"] else "No")
-            
-            # Salary info
-            salary_text = ""
-            if job["min_amount"] and job["max_amount"]:
-                salary_text = f"{job['min_amount']:,.0f} - {job['max_amount']:,.0f} {job['currency']} ({job['interval']})"
-            elif job["min_amount"]:
-                salary_text = f"{job['min_amount']:,.0f}+ {job['currency']} ({job['interval']})"
-            elif job["max_amount"]:
-                salary_text = f"Up to {job['max_amount']:,.0f} {job['currency']} ({job['interval']})"
-            
-            info_table.add_row("Salary", salary_text)
-            info_table.add_row("Site", job["site"] or "")
-            
-            # URLs
-            if job["job_url"]:
-                info_table.add_row("Job URL", job["job_url"])
-            if job["job_url_direct"]:
-                info_table.add_row("Direct Apply URL", job["job_url_direct"])
-            if job["company_url"]:
-                info_table.add_row("Company URL", job["company_url"])
-            
-            console.print(info_table)
-            
-            # Description
-            if job["description"]:
-                console.print(Panel(
-                    Markdown(job["description"]),
-                    title="Job Description",
-                    width=100
-                ))
+    conn = get_db_connection(read_only=True)
+    try:
+        # Bind the id with the column's own type so the primary key index is used
+        if id_is_integer(conn) and job_id.isdigit():
+            job_key = int(job_id)
+        else:
+            job_key = job_id
+        
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT *, {SALARY_DISPLAY_SQL} AS salary_display FROM scraped_jobs WHERE id = ?", (job_key,))
+        job = cursor.fetchone()
+        
+        if not job:
+            console.print(f"[bold red]Job with ID {job_id} not found[/bold red]")
+            return
+        
+        # Display job details
+        console.print(f"\n[bold cyan]{job['title']} at {job['company']}[/bold cyan]")
+        
+        # Basic info
+        info_table = Table(box=box.SIMPLE)
+        info_table.add_column("Field", style="bold blue")
+        info_table.add_column("Value", style="green")
+        
+        # Only fields with a value get a row; Remote is always shown
+        for label, column in VIEW_INFO_FIELDS:
+            if column == "is_remote":
+                info_table.add_row(label, "Yes" if job["is_remote"] else "No")
+            elif job[column]:
+                info_table.add_row(label, str(job[column]))
+        
+        console.print(info_table)
+        
+        # Description: short text without markdown syntax skips the Markdown parser
+        description = job["description"]
+        if description:
+            if len(description) < PLAIN_DESCRIPTION_LIMIT and not MARKDOWN_SYNTAX.search(description):
+                body = Text(description)
             else:
-                console.print("[yellow]No description available[/yellow]")
-            
-        except sqlite3.Error as e:
-            console.print(f"[bold red]Database error: {str(e)}[/bold red]")
+                from rich.markdown import Markdown
+                body = Markdown(description)
+            console.print(Panel(
+                body,
+                title="Job Description",
+                width=100
+            ))
+        else:
+            console.print("[yellow]No description available[/yellow]")
+        
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Database error: {str(e)}[/bold red]")
 
 @app.command("search")
 def search_jobs(
     query: str = typer.Argument(..., help="Text to search for in job titles and descriptions")
 ):
     """Search for jobs containing specific text in title or description"""
-    with get_db_connection() as conn:
-        try:
+    conn = get_db_connection(read_only=True)
+    try:
+        rows = []
+        has_fts_table = table_exists(conn, "jobs_fts_ids")
+        if has_fts_table:
+            # Match the text as a single quoted phrase, ranked by BM25
+            sql = """
+                SELECT j.id, j.title, j.company, j.location, j.date_posted, j.site
+                FROM jobs_fts f
+                JOIN scraped_jobs j ON j.id = f.id
+                WHERE jobs_fts MATCH ?
+                ORDER BY f.rank
+                LIMIT 20
+            """
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows = conn.execute(sql, (phrase,)).fetchall()
+        
+        if not rows:
+            # Fall back to substring matching (partial words, or no FTS5)
             sql = """
                 SELECT id, title, company, location, date_posted, site
                 FROM scraped_jobs
-                WHERE title LIKE ? OR description LIKE ?
+                WHERE title LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\'
                 ORDER BY date_posted DESC
                 LIMIT 20
             """
-            params = (f"%{query}%", f"%{query}%")
-            
-            df = pd.read_sql_query(sql, conn, params=params)
-            
-            if len(df) == 0:
-                console.print(f"[bold yellow]No jobs found containing '{query}'[/bold yellow]")
-                return
-            
-            # Display results
-            table = Table(
-                title=f"Search Results for '{query}' ({len(df)} matches)",
-                box=box.ROUNDED
-            )
-            
-            table.add_column("ID", style="dim")
-            table.add_column("Title", style="bold cyan")
-            table.add_column("Company", style="green")
-            table.add_column("Location", style="blue")
-            table.add_column("Posted", style="magenta")
-            table.add_column("Site", style="red")
-            
-            for _, row in df.iterrows():
-                table.add_row(
-                    str(row.get("id", "")),
-                    str(row.get("title", "")),
-                    str(row.get("company", "")),
-                    str(row.get("location", "")),
-                    str(row.get("date_posted", "")),
-                    str(row.get("site", ""))
-                )
-            
-            console.print(table)
-            console.print(f"\n[bold green]To view full details of a job, use: jobspy view <ID>[/bold green]")
-            
-        except sqlite3.Error as e:
-            console.print(f"[bold red]Database error: {str(e)}[/bold red]")
+            pattern = like_contains(query)
+            rows = conn.execute(sql, (pattern, pattern)).fetchall()
+        
+        if not rows:
+            console.print(f"[bold yellow]No jobs found containing '{query}'[/bold yellow]")
+            return
+        
+        # Display results
+        table = Table(
+            title=f"Search Results for '{query}' ({len(rows)} matches)",
+            box=box.ROUNDED
+        )
+        
+        table.add_column("ID", style="dim")
+        table.add_column("Title", style="bold cyan")
+        table.add_column("Company", style="green")
+        table.add_column("Location", style="blue")
+        table.add_column("Posted", style="magenta")
+        table.add_column("Site", style="red")
+        
+        # Columns are selected in display order
+        for row in rows:
+            table.add_row(*map(str, row))
+        
+        console.print(table)
+        console.print(f"\n[bold green]To view full details of a job, use: jobspy view <ID>[/bold green]")
+        
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Database error: {str(e)}[/bold red]")
 
 @app.command("run")
 def run_scraper():
@@ -466,97 +717,129 @@ def run_scraper():
         return
     
     console.print("[bold]Running Job Scraper...[/bold]")
+    from rich.progress import Progress
     
     try:
         with Progress() as progress:
             task = progress.add_task("[cyan]Running scraper...", total=None)
             
+            # Merge stderr into stdout so a single reader can't deadlock on a full pipe
             process = subprocess.Popen(
                 ["python", script_path],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1
             )
             
-            stdout, stderr = process.communicate()
+            # Stream output live, keeping only the tail for the summary panel
+            tail = deque(maxlen=SCRAPER_OUTPUT_TAIL)
+            for line in process.stdout:
+                progress.console.print(line.rstrip("\n"), markup=False, highlight=False)
+                progress.update(task, advance=1)
+                tail.append(line)
+            process.wait()
+            output = "".join(tail)
             
             if process.returncode == 0:
                 progress.update(task, completed=True)
                 console.print("[bold green]Job scraper completed successfully[/bold green]")
                 
                 # Show output
-                if stdout:
-                    console.print(Panel(stdout, title="Scraper Output", width=100))
+                if output:
+                    console.print(Panel(output, title="Scraper Output", width=100))
             else:
                 progress.update(task, completed=True)
                 console.print("[bold red]Job scraper failed[/bold red]")
-                console.print(Panel(stderr, title="Error", width=100, border_style="red"))
+                console.print(Panel(output, title="Error", width=100, border_style="red"))
     
     except Exception as e:
         console.print(f"[bold red]Error running job scraper: {str(e)}[/bold red]")
 
+def get_filter_options(conn):
+    """Get the distinct filter values, reusing the cached copy while scraped_jobs is unchanged
+    
+    The cache is keyed on MAX(rowid) of scraped_jobs (an index lookup) and the
+    trigger-maintained row count in _counts, so inserts and deletes invalidate it
+    without a table scan. UPDATEs change neither and do not invalidate it; neither
+    does deleting the newest row and inserting another in its place.
+    """
+    row_watermark, row_count = conn.execute(
+        "SELECT (SELECT MAX(rowid) FROM scraped_jobs), (SELECT n FROM _counts WHERE name = 'scraped_jobs')"
+    ).fetchone()
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS _filter_cache (key TEXT PRIMARY KEY, value TEXT, row_watermark INTEGER, row_count INTEGER)"
+    )
+    cached = conn.execute(
+        "SELECT value FROM _filter_cache WHERE key = 'filters' AND row_watermark IS ? AND row_count IS ?",
+        (row_watermark, row_count)
+    ).fetchone()
+    if cached:
+        return json_loads(cached["value"])
+    
+    filters = {
+        "queries": [row[0] for row in conn.execute(
+            "SELECT DISTINCT search_query FROM scraped_jobs ORDER BY search_query"
+        )],
+        "sites": [row[0] for row in conn.execute(
+            "SELECT DISTINCT site FROM scraped_jobs ORDER BY site"
+        )],
+        "types": [row[0] for row in conn.execute(
+            "SELECT DISTINCT job_type FROM scraped_jobs WHERE job_type IS NOT NULL ORDER BY job_type"
+        )],
+        # Top 10 locations
+        "locations": [tuple(row) for row in conn.execute(
+            """
+            SELECT location, COUNT(*) as count
+            FROM scraped_jobs
+            GROUP BY location
+            ORDER BY count DESC
+            LIMIT 10
+            """
+        )],
+    }
+    
+    conn.execute(
+        "INSERT OR REPLACE INTO _filter_cache (key, value, row_watermark, row_count) VALUES ('filters', ?, ?, ?)",
+        (json_dumps(filters), row_watermark, row_count)
+    )
+    conn.commit()
+    return filters
+
 @app.command("filters")
 def show_filters():
     """Show available filter options for jobs"""
-    with get_db_connection() as conn:
-        try:
-            # Get search queries
-            df_queries = pd.read_sql_query(
-                "SELECT DISTINCT search_query FROM scraped_jobs ORDER BY search_query",
-                conn
-            )
-            
-            # Get sites
-            df_sites = pd.read_sql_query(
-                "SELECT DISTINCT site FROM scraped_jobs ORDER BY site",
-                conn
-            )
-            
-            # Get job types
-            df_types = pd.read_sql_query(
-                "SELECT DISTINCT job_type FROM scraped_jobs WHERE job_type IS NOT NULL ORDER BY job_type",
-                conn
-            )
-            
-            # Get locations (top 10)
-            df_locations = pd.read_sql_query(
-                """
-                SELECT location, COUNT(*) as count
-                FROM scraped_jobs
-                GROUP BY location
-                ORDER BY count DESC
-                LIMIT 10
-                """,
-                conn
-            )
-            
-            # Display filters
-            console.print("\n[bold]Available Filter Options[/bold]")
-            
-            console.print("\n[bold cyan]Search Queries:[/bold cyan]")
-            for query in df_queries["search_query"]:
-                console.print(f"  - {query}")
-            
-            console.print("\n[bold cyan]Job Sites:[/bold cyan]")
-            for site in df_sites["site"]:
-                console.print(f"  - {site}")
-            
-            console.print("\n[bold cyan]Job Types:[/bold cyan]")
-            for job_type in df_types["job_type"]:
-                console.print(f"  - {job_type}")
-            
-            console.print("\n[bold cyan]Top Locations:[/bold cyan]")
-            for _, row in df_locations.iterrows():
-                console.print(f"  - {row['location']} ({row['count']} jobs)")
-            
-            # Example commands
-            console.print("\n[bold green]Example Commands:[/bold green]")
-            console.print("  jobspy list --query \"Software Engineer\" --site linkedin --remote")
-            console.print("  jobspy list --salary 100000 --days 7 --limit 10")
-            console.print("  jobspy list --title \"Data Scientist\" --export csv")
-            
-        except sqlite3.Error as e:
-            console.print(f"[bold red]Database error: {str(e)}[/bold red]")
+    conn = get_db_connection()
+    try:
+        filters = get_filter_options(conn)
+        
+        # Display filters
+        console.print("\n[bold]Available Filter Options[/bold]")
+        
+        console.print("\n[bold cyan]Search Queries:[/bold cyan]")
+        for query in filters["queries"]:
+            console.print(f"  - {query}")
+        
+        console.print("\n[bold cyan]Job Sites:[/bold cyan]")
+        for site in filters["sites"]:
+            console.print(f"  - {site}")
+        
+        console.print("\n[bold cyan]Job Types:[/bold cyan]")
+        for job_type in filters["types"]:
+            console.print(f"  - {job_type}")
+        
+        console.print("\n[bold cyan]Top Locations:[/bold cyan]")
+        for location, count in filters["locations"]:
+            console.print(f"  - {location} ({count} jobs)")
+        
+        # Example commands
+        console.print("\n[bold green]Example Commands:[/bold green]")
+        console.print("  jobspy list --query \"Software Engineer\" --site linkedin --remote")
+        console.print("  jobspy list --salary 100000 --days 7 --limit 10")
+        console.print("  jobspy list --title \"Data Scientist\" --export csv")
+        
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Database error: {str(e)}[/bold red]")
 
 @app.command("export")
 def export_jobs(
@@ -568,113 +851,143 @@ def export_jobs(
     all_jobs: bool = typer.Option(False, help="Export all jobs")
 ):
     """Export jobs to file format"""
-    with get_db_connection() as conn:
-        try:
-            # Build query
-            query_str = "SELECT * FROM scraped_jobs WHERE 1=1"
-            params = []
-            
-            if query:
-                query_str += " AND search_query = ?"
-                params.append(query)
-            
-            if site:
-                query_str += " AND site = ?"
-                params.append(site)
-            
-            if not all_jobs and days > 0:
-                date_limit = (datetime.now() - timedelta(days=days)).isoformat()
-                query_str += " AND date_posted >= ?"
-                params.append(date_limit)
-            
-            query_str += " ORDER BY date_posted DESC"
-            
-            # Execute query
-            df = pd.read_sql_query(query_str, conn, params=params)
-            
-            if len(df) == 0:
-                console.print("[bold yellow]No jobs found matching your criteria[/bold yellow]")
-                return
-            
-            # Set output path
-            if not output:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output = f"jobspy_export_{timestamp}"
-            
-            # Export based on format
-            if format.lower() == "csv":
-                output_path = f"{output}.csv" if not output.endswith(".csv") else output
-                df.to_csv(output_path, index=False)
-            elif format.lower() == "excel":
-                output_path = f"{output}.xlsx" if not output.endswith(".xlsx") else output
-                df.to_excel(output_path, index=False)
-            elif format.lower() == "json":
-                output_path = f"{output}.json" if not output.endswith(".json") else output
-                df.to_json(output_path, orient="records", indent=4)
-            else:
-                console.print(f"[bold red]Invalid format: {format}. Use csv, excel, or json.[/bold red]")
-                return
-            
-            console.print(f"[bold green]Successfully exported {len(df)} jobs to {output_path}[/bold green]")
-            
-        except sqlite3.Error as e:
-            console.print(f"[bold red]Database error: {str(e)}[/bold red]")
-        except Exception as e:
-            console.print(f"[bold red]Export error: {str(e)}[/bold red]")
+    conn = get_db_connection(read_only=True)
+    try:
+        # Build query
+        query_str = "SELECT * FROM scraped_jobs WHERE 1=1"
+        params = []
+        
+        if query:
+            query_str += " AND search_query = ?"
+            params.append(query)
+        
+        if site:
+            query_str += " AND site = ?"
+            params.append(site)
+        
+        if not all_jobs and days > 0:
+            date_limit = (datetime.now() - timedelta(days=days)).isoformat()
+            query_str += " AND date_posted >= ?"
+            params.append(date_limit)
+        
+        query_str += " ORDER BY date_posted DESC"
+        
+        # Execute query and stream results in chunks
+        cursor = conn.execute(query_str, params)
+        columns = [d[0] for d in cursor.description]
+        chunk = cursor.fetchmany(EXPORT_CHUNK_SIZE)
+        
+        if not chunk:
+            console.print("[bold yellow]No jobs found matching your criteria[/bold yellow]")
+            return
+        
+        # Set output path
+        if not output:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output = f"jobspy_export_{timestamp}"
+        
+        # Export based on format
+        exported = 0
+        if format.lower() == "csv":
+            output_path = f"{output}.csv" if not output.endswith(".csv") else output
+            with open(output_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                while chunk:
+                    writer.writerows(chunk)
+                    exported += len(chunk)
+                    chunk = cursor.fetchmany(EXPORT_CHUNK_SIZE)
+        elif format.lower() == "json":
+            # Write the records array one object at a time
+            output_path = f"{output}.json" if not output.endswith(".json") else output
+            batches = itertools.chain([chunk], iter(lambda: cursor.fetchmany(EXPORT_CHUNK_SIZE), []))
+            exported = write_json_records(output_path, columns, batches)
+        elif format.lower() == "excel":
+            # Write-only workbook streams rows to disk instead of holding the sheet in memory
+            from openpyxl import Workbook
+            output_path = f"{output}.xlsx" if not output.endswith(".xlsx") else output
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            ws.append(columns)
+            while chunk:
+                for row in chunk:
+                    ws.append(tuple(row))
+                exported += len(chunk)
+                chunk = cursor.fetchmany(EXPORT_CHUNK_SIZE)
+            wb.save(output_path)
+        else:
+            console.print(f"[bold red]Invalid format: {format}. Use csv, excel, or json.[/bold red]")
+            return
+        
+        console.print(f"[bold green]Successfully exported {exported} jobs to {output_path}[/bold green]")
+        
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Database error: {str(e)}[/bold red]")
+    except Exception as e:
+        console.print(f"[bold red]Export error: {str(e)}[/bold red]")
 
 @app.command("history")
 def show_history():
     """Show search history from the job scraper"""
-    with get_db_connection() as conn:
-        try:
-            df = pd.read_sql_query(
-                "SELECT * FROM search_history ORDER BY timestamp DESC",
-                conn
-            )
-            
-            if len(df) == 0:
-                console.print("[bold yellow]No search history found[/bold yellow]")
-                return
-            
-            table = Table(
-                title="Search History",
-                box=box.ROUNDED
-            )
-            
-            table.add_column("ID", style="dim")
-            table.add_column("Search Query", style="cyan")
-            table.add_column("Date", style="green")
-            table.add_column("Jobs Found", style="yellow")
-            
-            for _, row in df.iterrows():
-                table.add_row(
-                    str(row.get("id", "")),
-                    str(row.get("search_query", "")),
-                    str(row.get("timestamp", "")),
-                    str(row.get("jobs_found", ""))
-                )
-            
-            console.print(table)
-            
-            # Show parameters for the most recent search
-            if len(df) > 0:
-                recent = df.iloc[0]
-                try:
-                    params = json.loads(recent.get("parameters", "{}"))
-                    console.print("\n[bold]Most Recent Search Parameters:[/bold]")
-                    params_table = Table(box=box.SIMPLE)
-                    params_table.add_column("Parameter", style="cyan")
-                    params_table.add_column("Value", style="green")
-                    
-                    for key, value in params.items():
-                        params_table.add_row(key, str(value))
-                    
-                    console.print(params_table)
-                except json.JSONDecodeError:
-                    pass
-            
-        except sqlite3.Error as e:
-            console.print(f"[bold red]Database error: {str(e)}[/bold red]")
+    import pandas as pd
+    conn = get_db_connection(read_only=True)
+    try:
+        df = pd.read_sql_query(
+            "SELECT * FROM search_history ORDER BY timestamp DESC",
+            conn
+        )
+        
+        if len(df) == 0:
+            console.print("[bold yellow]No search history found[/bold yellow]")
+            return
+        
+        table = Table(
+            title="Search History",
+            box=box.ROUNDED
+        )
+        
+        table.add_column("ID", style="dim")
+        table.add_column("Search Query", style="cyan")
+        table.add_column("Date", style="green")
+        table.add_column("Jobs Found", style="yellow")
+        
+        history_columns = ["id", "search_query", "timestamp", "jobs_found"]
+        for row in df[history_columns].itertuples(index=False, name=None):
+            table.add_row(*map(str, row))
+        
+        console.print(table)
+        
+        # Show parameters for the most recent search
+        if len(df) > 0:
+            recent = df.iloc[0]
+            try:
+                params = json_loads(recent.get("parameters") or "{}")
+                console.print("\n[bold]Most Recent Search Parameters:[/bold]")
+                params_table = Table(box=box.SIMPLE)
+                params_table.add_column("Parameter", style="cyan")
+                params_table.add_column("Value", style="green")
+                
+                for key, value in params.items():
+                    params_table.add_row(key, str(value))
+                
+                console.print(params_table)
+            except json.JSONDecodeError:
+                pass
+        
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Database error: {str(e)}[/bold red]")
+
+def load_config(config_path):
+    """Load a JSON config file, memoized on its modification time"""
+    mtime = os.path.getmtime(config_path)
+    cached = _config_cache.get(config_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    with open(config_path, 'r') as f:
+        config = json.load(f)
+    _config_cache[config_path] = (mtime, config)
+    return config
 
 @app.command("config")
 def show_config():
@@ -686,8 +999,7 @@ def show_config():
         return
     
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = load_config(config_path)
         
         # Display the configuration
         console.print("[bold]Job Search Configuration[/bold]")
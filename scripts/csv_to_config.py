@@ -27,6 +27,28 @@ def parse_bool(value):
     return str(value).strip().lower() == 'true'
 
 
+def parse_site_names(value):
+    """
+    Parse a site_name cell, usually a Python list repr such as ['indeed', 'linkedin'].
+    Values with no backslashes or double quotes are tried as JSON after swapping the
+    quotes, which gives the same list as ast.literal_eval for plain strings; any other
+    value, or a JSON result that is not a list of strings, takes the original path of
+    ast.literal_eval and then a comma split.
+    """
+    if '\\' not in value and '"' not in value:
+        try:
+            site_names = json.loads(value.replace("'", '"'))
+        except ValueError:
+            site_names = None
+        if isinstance(site_names, list) and all(isinstance(s, str) for s in site_names):
+            return site_names
+
+    try:
+        return ast.literal_eval(value)
+    except Exception:
+        return [s.strip() for s in value.split(',') if s.strip()]
+
+
 def version_existing_file(path):
     """
     If the given file exists, rename it by appending a timestamp.
@@ -45,34 +67,46 @@ def load_jobs_from_csv(csv_path):
     """
     jobs = []
     with open(csv_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        # Column positions, resolved once from the header
+        index = {column: i for i, column in enumerate(header)}
+
+        def field(row, key, default=''):
+            """Return the row's value for a column, or default if the column or value is missing"""
+            i = index.get(key)
+            if i is None or i >= len(row):
+                return default
+            return row[i]
+
         for row in reader:
-            name = row.get('name', '').strip()
-            enabled = parse_bool(row.get('enabled', 'True'))
+            if not row:
+                continue  # Blank line
+
+            name = field(row, 'name').strip()
+            enabled = parse_bool(field(row, 'enabled', 'True'))
 
             params = {}
             # Parse list fields
-            site_name_str = row.get('site_name', '').strip()
+            site_name_str = field(row, 'site_name').strip()
             if site_name_str:
-                try:
-                    params['site_name'] = ast.literal_eval(site_name_str)
-                except Exception:
-                    params['site_name'] = [s.strip() for s in site_name_str.split(',') if s.strip()]
+                params['site_name'] = parse_site_names(site_name_str)
 
             # String fields
             for key in ('search_term', 'location', 'google_search_term', 'country_indeed'):
-                val = row.get(key, '').strip()
+                val = field(row, key).strip()
                 if val:
                     params[key] = val
 
             # Boolean fields
             for key in ('is_remote', 'linkedin_fetch_description'):
-                if key in row and row[key].strip():
-                    params[key] = parse_bool(row[key])
+                val = field(row, key).strip()
+                if val:
+                    params[key] = parse_bool(val)
 
             # Integer fields
             for key in ('hours_old', 'results_wanted'):
-                val = row.get(key, '').strip()
+                val = field(row, key).strip()
                 if val:
                     try:
                         params[key] = int(val)
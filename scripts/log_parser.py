@@ -3,20 +3,112 @@
 Job Scraper Log Parser
 Converts job scraper log files into tab-separated format for analysis
 Handles multiple batch runs within a single log file
+Pure Python with no compiled dependencies, so it also runs unchanged under PyPy
 """
 
 import re
 import ast
+import argparse
 import csv
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+import functools
+import heapq
+import itertools
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Every literal the batch scanner and process_batch look for, with the flag set on
+# lines that contain it; only lines containing one of these are ever decoded
+SCRAPER_START, DB_CONNECTED, DB_INITIALIZED, SEARCH_START, PARAMETERS, SEARCH_COMPLETED, SCRAPER_FINISHED = (
+    1 << n for n in range(7)
+)
+LOG_MARKERS = {
+    b"Starting JobSpy Scraper with PostgreSQL": SCRAPER_START,
+    b"Connected to PostgreSQL database successfully": DB_CONNECTED,
+    b"PostgreSQL database initialized": DB_INITIALIZED,
+    b"Starting search for:": SEARCH_START,
+    b"Parameters:": PARAMETERS,
+    b"Search completed for": SEARCH_COMPLETED,
+    b"JobSpy Scraper finished": SCRAPER_FINISHED,
+}
+
+# (line index, marker flags, stripped line) for one marker line of the log
+LogEvent = Tuple[int, int, str]
+
+# Output columns, in the order process_batch builds each row
+QUERY_FIELDS = (
+    'batch', 'start_timestamp', 'end_timestamp', 'found_jobs', 'new_jobs',
+    'name', 'enabled', 'site_name', 'search_term', 'location',
+    'is_remote', 'hours_old', 'results_wanted', 'country_indeed',
+    'linkedin_fetch_description', 'google_search_term', 'description_format',
+    'enforce_annual_salary', 'verbose', 'distance'
+)
+_FOUND_COL, _NEW_COL, _NAME_COL = 3, 4, 5
+
+# Parameters copied straight into the row after site_name, with their defaults
+_PARAM_DEFAULTS = {
+    'search_term': '',
+    'location': '',
+    'is_remote': False,
+    'hours_old': '',
+    'results_wanted': '',
+    'country_indeed': '',
+    'linkedin_fetch_description': '',
+    'google_search_term': '',
+    'description_format': '',
+    'enforce_annual_salary': '',
+    'verbose': '',
+    'distance': '',
+}
+_PARAM_KEYS = tuple(_PARAM_DEFAULTS)
+_PARAM_DEFAULT_VALUES = tuple(_PARAM_DEFAULTS.values())
+# site_name is written as a Python list repr, which csv_to_config reads back;
+# this is the value for searches logged without one
+_EMPTY_LIST_REPR = '[]'
+
+# Bytes per slice when counting newlines in the mapped file
+LINE_COUNT_CHUNK = 1 << 20
+
+# Write buffer for the TSV output, so rows reach disk in large blocks
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Patterns compiled once for the per-line hot path
+_TS_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d+)')
+_TS_PREFIX_LEN = 21  # 'YYYY-MM-DD HH:MM:SS,' plus the first millisecond digit _TS_RE needs
+_FOUND_RE = re.compile(r'Found (\d+) jobs, (\d+) new\.')
+_NAME_RE = re.compile(r'Starting search for: (.+)')
+
+# Search start and completion lines in one match: timestamp (without milliseconds)
+# plus the name, or the job counts. Lines it misses go through the helpers above
+_EVENT_RE = re.compile(
+    r'(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+.*?'
+    r'(?:Starting search for: (?P<name>.+)'
+    r'|Search completed for .*?Found (?P<found>\d+) jobs, (?P<new>\d+) new\.)'
+)
+
+# Fast path for Parameters dicts whose values are plain strings, ints, bools, None or
+# lists of plain strings; anything else falls back to ast.literal_eval
+_PARAM_VALUE = r"'[^'\\]*'|-?\d+|True|False|None|\[(?:'[^'\\]*'(?:, '[^'\\]*')*)?\]"
+_PARAM_ITEM = rf"'(\w+)': ({_PARAM_VALUE})"
+_PARAMS_DICT_RE = re.compile(rf"\{{(?:{_PARAM_ITEM}(?:, {_PARAM_ITEM})*)?\}}")
+_PARAM_RE = re.compile(_PARAM_ITEM)
+_PARAM_LIST_ITEM_RE = re.compile(r"'([^'\\]*)'")
+_PARAM_CONSTANTS = {'True': True, 'False': False, 'None': None}
 
 def parse_timestamp(timestamp_str: str) -> str:
     """Convert log timestamp to Excel/database friendly format"""
-    # Remove milliseconds and convert to standard format
-    timestamp_str = timestamp_str.split(',')[0]  # Remove milliseconds
-    dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-    return dt.strftime('%Y-%m-%d %H:%M:%S')
+    # The log already uses '%Y-%m-%d %H:%M:%S,mmm' (checked by _TS_RE), so just drop the milliseconds
+    return timestamp_str.split(',', 1)[0]
+
+@functools.lru_cache(maxsize=4096)
+def _extract_ts(prefix: str) -> Optional[str]:
+    """Parsed timestamp for a line starting with prefix (its first _TS_PREFIX_LEN chars), or None"""
+    # Lines logged within the same second share a prefix, so most calls are cache hits
+    timestamp_match = _TS_RE.match(prefix)
+    return parse_timestamp(timestamp_match.group(1)) if timestamp_match else None
 
 def parse_parameters(params_str: str) -> Dict:
     """Parse the parameters dictionary from log string"""
@@ -25,7 +117,21 @@ def parse_parameters(params_str: str) -> Dict:
     if dict_start == -1:
         return {}
     
-    dict_str = params_str[dict_start:]
+    dict_str = params_str[dict_start:].rstrip()
+    
+    if _PARAMS_DICT_RE.fullmatch(dict_str):
+        params_dict = {}
+        for key, value in _PARAM_RE.findall(dict_str):
+            if value[0] == "'":
+                params_dict[key] = value[1:-1]
+            elif value[0] == '[':
+                params_dict[key] = _PARAM_LIST_ITEM_RE.findall(value)
+            elif value in _PARAM_CONSTANTS:
+                params_dict[key] = _PARAM_CONSTANTS[value]
+            else:
+                params_dict[key] = int(value)
+        return params_dict
+    
     try:
         # Use ast.literal_eval for safe evaluation of the dictionary
         params_dict = ast.literal_eval(dict_str)
@@ -38,8 +144,7 @@ def parse_parameters(params_str: str) -> Dict:
 def extract_job_counts(completion_line: str) -> Tuple[int, int]:
     """Extract found jobs and new jobs from completion line"""
     # Pattern: "Search completed for X. Found Y jobs, Z new."
-    pattern = r'Found (\d+) jobs, (\d+) new\.'
-    match = re.search(pattern, completion_line)
+    match = _FOUND_RE.search(completion_line)
     if match:
         return int(match.group(1)), int(match.group(2))
     return 0, 0
@@ -47,210 +152,326 @@ def extract_job_counts(completion_line: str) -> Tuple[int, int]:
 def extract_search_name(start_line: str) -> str:
     """Extract search name from starting line"""
     # Pattern: "Starting search for: NAME"
-    pattern = r'Starting search for: (.+)'
-    match = re.search(pattern, start_line)
+    match = _NAME_RE.search(start_line)
     if match:
         return match.group(1)
     return ""
 
-def find_batch_boundaries(lines: List[str]) -> List[Tuple[int, int]]:
-    """Find all job scraping batch runs in the log file"""
-    batches = []
+def count_lines(mm: mmap.mmap) -> int:
+    """Count lines the way readlines() would, in fixed-size slices of the mapped file"""
+    newlines = 0
+    for offset in range(0, len(mm), LINE_COUNT_CHUNK):
+        newlines += mm[offset:offset + LINE_COUNT_CHUNK].count(b"\n")
+    if len(mm) and mm[len(mm) - 1:] != b"\n":
+        newlines += 1  # Last line has no trailing newline
+    return newlines
+
+def _iter_marker_lines(mm: mmap.mmap, marker: bytes, flag: int) -> Iterator[Tuple[int, int]]:
+    """Yield (line start offset, flag) for each occurrence of marker, in file order"""
+    pos = mm.find(marker)
+    while pos != -1:
+        yield mm.rfind(b"\n", 0, pos) + 1, flag
+        pos = mm.find(marker, pos + len(marker))
+
+def iter_log_events(mm: mmap.mmap) -> Iterator[LogEvent]:
+    """Yield a LogEvent for every line containing one of LOG_MARKERS
     
-    # Find all job scraping sequences (3 specific lines in order + validation)
-    scraper_starts = []
-    for i, line in enumerate(lines):
-        if "Starting JobSpy Scraper with PostgreSQL" in line:
-            # Check if the next lines match the expected pattern within a reasonable range
-            found_connection = False
-            found_init = False
-            connection_idx = -1
-            init_idx = -1
-            
-            # Look for the connection and initialization lines within the next 10 lines
-            for j in range(i + 1, min(i + 11, len(lines))):
-                if not found_connection and "Connected to PostgreSQL database successfully" in lines[j]:
-                    found_connection = True
-                    connection_idx = j
-                elif found_connection and not found_init and "PostgreSQL database initialized" in lines[j]:
-                    found_init = True
-                    init_idx = j
-                    break
-            
-            # If we found both lines, validate that this is actually a scraping batch
-            if found_connection and found_init:
-                # Look for "Starting search for:" within the next 5 lines after initialization
-                has_search = False
-                for k in range(init_idx + 1, min(init_idx + 6, len(lines))):
-                    if "Starting search for:" in lines[k]:
-                        has_search = True
-                        break
-                
-                # Only add this as a valid batch start if it has actual searches
-                if has_search:
-                    scraper_starts.append(init_idx)  # Use the database initialized line as start
-                    print(f"Found job scraping batch start at line {init_idx + 1}")
+    Marker hits are located with mmap.find, so lines without a marker are never
+    split or decoded, and the flags record which markers a line holds so consumers
+    never search it for them again. Yielded lines are stripped once here, so
+    consumers never strip them again. The per-marker scans are merged as they go,
+    so only one pending hit per marker is held at a time.
+    """
+    scans = [_iter_marker_lines(mm, marker, flag) for marker, flag in LOG_MARKERS.items()]
+    line_idx = 0
+    prev_start = 0
+    for start, hits in itertools.groupby(heapq.merge(*scans), key=itemgetter(0)):
+        flags = 0
+        for _, flag in hits:
+            flags |= flag
+        line_idx += mm[prev_start:start].count(b"\n")
+        end = mm.find(b"\n", start)
+        if end == -1:
+            end = len(mm)
+        yield line_idx, flags, mm[start:end].decode('utf-8').strip()
+        prev_start = start
+
+def iter_batches(events: Iterable[LogEvent], total_lines: int) -> Iterator[Tuple[int, int, List[LogEvent]]]:
+    """Yield (start, end, events) for each job scraping batch run
+    
+    A batch starts at the "database initialized" line of a "Starting JobSpy Scraper"
+    / "Connected" / "initialized" sequence (the last two within 10 lines of the first)
+    that is followed by a search within 5 lines. It ends at the next
+    "JobSpy Scraper finished", or just before the next batch start, or at end of file.
     
-    # For each scraper start, find its corresponding end
-    for i, start_idx in enumerate(scraper_starts):
-        # Look for the next "JobSpy Scraper finished" after this start
-        end_idx = None
-        search_start = start_idx + 1
+    Every "Starting JobSpy Scraper" line opens its own window, so a start logged by
+    another scraper.py run inside a batch's start sequence does not cancel it.
+    
+    Args:
+        events: LogEvents from iter_log_events
+        total_lines: Number of lines in the log
+    """
+    starts = []  # [last line index of the window, saw "Connected"] per open scraper start
+    inits = []  # (line index, last line index that may hold the first search) per "initialized" line
+    recent = []  # Events since the oldest "initialized" line still waiting for a search
+    batch_start = None
+    batch_events = None
+    finish_idx = None  # The open batch's "finished" line, while a waiting batch start may precede it
+    
+    for event in events:
+        i, flags = event[0], event[1]
         
-        # If there's another batch start, don't search beyond it
-        search_limit = len(lines)
-        if i + 1 < len(scraper_starts):
-            search_limit = scraper_starts[i + 1]
+        # Windows are checked when the next marker line arrives; lines in between
+        # cannot change any state
+        inits = [init for init in inits if i <= init[1]]
+        if finish_idx is not None and not inits:
+            # No new batch started before the finished line, so it ends the open batch
+            yield batch_start, finish_idx, [e for e in batch_events if e[0] <= finish_idx]
+            batch_start = batch_events = finish_idx = None
         
-        for j in range(search_start, search_limit):
-            if "JobSpy Scraper finished" in lines[j]:
-                end_idx = j
-                break
+        if batch_events is not None:
+            batch_events.append(event)
+            if flags & SCRAPER_FINISHED and finish_idx is None:
+                if inits:
+                    finish_idx = i
+                else:
+                    yield batch_start, i, batch_events
+                    batch_start = batch_events = None
         
-        # If no explicit end found, use the line before next batch or end of file
-        if end_idx is None:
-            if i + 1 < len(scraper_starts):
-                end_idx = scraper_starts[i + 1] - 1
-            else:
-                end_idx = len(lines) - 1
+        if inits:
+            recent.append(event)
+            if flags & SEARCH_START:
+                # Only a start followed by actual searches counts as a batch
+                init_lines = [init_idx for init_idx, _ in inits]
+                for n, init_idx in enumerate(init_lines):
+                    if batch_events is not None:
+                        end = finish_idx if finish_idx is not None and finish_idx < init_idx else init_idx - 1
+                        yield batch_start, end, [e for e in batch_events if e[0] <= end]
+                        finish_idx = None
+                    batch_start = init_idx  # Use the database initialized line as start
+                    batch_events = [e for e in recent if e[0] >= init_idx]
+                    print(f"Found job scraping batch start at line {init_idx + 1}")
+                    
+                    # The batch may already have finished before its first search
+                    limit = init_lines[n + 1] if n + 1 < len(init_lines) else i + 1
+                    end = next((e[0] for e in batch_events
+                                if init_idx < e[0] < limit and e[1] & SCRAPER_FINISHED), None)
+                    if end is not None:
+                        yield batch_start, end, [e for e in batch_events if e[0] <= end]
+                        batch_start = batch_events = None
+                inits = []
+        
+        initialized = False
+        open_starts = []
+        for start in starts:
+            if i > start[0]:
+                continue
+            if not start[1]:
+                start[1] = bool(flags & DB_CONNECTED)
+            elif flags & DB_INITIALIZED:
+                initialized = True
+                continue  # This start's sequence is complete
+            open_starts.append(start)
+        starts = open_starts
         
-        batches.append((start_idx, end_idx))
+        if initialized:
+            if not inits:
+                recent = [event]
+            inits.append((i, i + 5))
+        if flags & SCRAPER_START:
+            starts.append([i + 10, False])
     
-    return batches
+    if batch_events is not None:
+        end = finish_idx if finish_idx is not None else total_lines - 1
+        yield batch_start, end, [e for e in batch_events if e[0] <= end]
 
-def process_batch(lines: List[str], start_idx: int, end_idx: int, batch_num: int) -> List[Dict]:
-    """Process a single batch of scraper execution"""
-    print(f"\nProcessing Batch {batch_num} (lines {start_idx} to {end_idx})")
+def count_searches(events: Iterable[LogEvent]) -> int:
+    """Count the searches process_batch would record, without parsing them"""
+    return sum(1 for _, flags, line in events
+               if flags & SEARCH_START and _extract_ts(line[:_TS_PREFIX_LEN]) is not None)
+
+def process_batch(events: List[LogEvent], batch_num: int) -> List[Tuple]:
+    """Process a single batch of scraper execution into QUERY_FIELDS-ordered rows
+    
+    Depends only on its arguments and the module's constant patterns and does no
+    printing, so it can run in a worker process.
     
-    queries = []
-    i = start_idx
+    Args:
+        events: The batch's marker lines, as yielded by iter_batches
+        batch_num: Batch number to record on each query
+    """
+    rows = []
+    # Searches still waiting for their completion line, oldest first, as
+    # (row, search_name, last line index a completion may be on)
+    window = deque()
+    last_search_idx = -2
+    extract_ts = _extract_ts  # Local aliases for the hot loop
+    event_match = _EVENT_RE.match
     
-    while i <= end_idx:
-        line = lines[i].strip()
+    for i, flags, line in events:
+        # Parameters lines are long and never a search or completion, so skip the match there
+        event = event_match(line) if not flags & PARAMETERS else None
+        kind = event.lastgroup if event else None  # 'name' for a search, 'new' for a completion
+        
+        # Searches whose 19-line window has passed keep their defaults
+        while window and window[0][2] < i:
+            window.popleft()
+        
+        # A completion line finishes every waiting search whose name it contains
+        if window and flags & SEARCH_COMPLETED:
+            done = [entry for entry in window if entry[1] in line]
+            if done:
+                if kind == 'new':
+                    found_jobs, new_jobs = int(event['found']), int(event['new'])
+                    end_timestamp = event['ts']
+                else:
+                    found_jobs, new_jobs = extract_job_counts(line)
+                    end_timestamp = extract_ts(line[:_TS_PREFIX_LEN])
+                for row, _, _ in done:
+                    row[3], row[4] = found_jobs, new_jobs
+                    if end_timestamp:
+                        row[2] = end_timestamp
+                window = deque(entry for entry in window if entry[1] not in line)
         
-        if "Starting search for:" in line:
-            # Extract timestamp and search name
-            timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d+)', line)
-            if not timestamp_match:
-                i += 1
+        # Parameters belong to the search on the line just before
+        if i == last_search_idx + 1 and flags & PARAMETERS:
+            params_dict = parse_parameters(line)
+            rows[-1][7:] = (
+                str(params_dict['site_name']) if 'site_name' in params_dict else _EMPTY_LIST_REPR,
+                *map(params_dict.get, _PARAM_KEYS, _PARAM_DEFAULT_VALUES)
+            )
+        
+        # Extract timestamp and search name
+        if kind == 'name':
+            start_timestamp, search_name = event['ts'], event['name']
+        elif flags & SEARCH_START:
+            start_timestamp = extract_ts(line[:_TS_PREFIX_LEN])
+            if start_timestamp is None:
                 continue
-                
-            start_timestamp = parse_timestamp(timestamp_match.group(1))
             search_name = extract_search_name(line)
-            
-            # Look for parameters line (should be next)
-            params_dict = {}
-            if i + 1 < len(lines) and "Parameters:" in lines[i + 1]:
-                params_dict = parse_parameters(lines[i + 1])
-            
-            # Look for completion and results lines
-            found_jobs = 0
-            new_jobs = 0
-            end_timestamp = start_timestamp
-            
-            # Search forward for completion line (within this batch)
-            for j in range(i + 1, min(i + 20, end_idx + 1)):
-                if "Search completed for" in lines[j] and search_name in lines[j]:
-                    found_jobs, new_jobs = extract_job_counts(lines[j])
-                    timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d+)', lines[j])
-                    if timestamp_match:
-                        end_timestamp = parse_timestamp(timestamp_match.group(1))
-                    break
-            
-            # Build query record with batch information
-            query = {
-                'batch': batch_num,
-                'start_timestamp': start_timestamp,
-                'end_timestamp': end_timestamp,
-                'found_jobs': found_jobs,
-                'new_jobs': new_jobs,
-                'name': search_name,
-                'enabled': True,  # Assuming all logged queries were enabled
-                'site_name': str(params_dict.get('site_name', [])),
-                'search_term': params_dict.get('search_term', ''),
-                'location': params_dict.get('location', ''),
-                'is_remote': params_dict.get('is_remote', False),
-                'hours_old': params_dict.get('hours_old', ''),
-                'results_wanted': params_dict.get('results_wanted', ''),
-                'country_indeed': params_dict.get('country_indeed', ''),
-                'linkedin_fetch_description': params_dict.get('linkedin_fetch_description', ''),
-                'google_search_term': params_dict.get('google_search_term', ''),
-                'description_format': params_dict.get('description_format', ''),
-                'enforce_annual_salary': params_dict.get('enforce_annual_salary', ''),
-                'verbose': params_dict.get('verbose', ''),
-                'distance': params_dict.get('distance', '')
-            }
-            
-            queries.append(query)
-            print(f"  Processed: {search_name} ({found_jobs} found, {new_jobs} new)")
+        else:
+            continue
         
-        i += 1
+        # Start the output row in QUERY_FIELDS order, with no results or parameters yet
+        row = [
+            batch_num, start_timestamp, start_timestamp, 0, 0, search_name,
+            True,  # Assuming all logged queries were enabled
+            _EMPTY_LIST_REPR, *_PARAM_DEFAULT_VALUES
+        ]
+        rows.append(row)
+        window.append((row, search_name, i + 19))
+        last_search_idx = i
     
-    return queries
+    return [tuple(row) for row in rows]
 
-def process_log_file(input_file: str, output_file: str, batch_start_num: int = 1):
-    """Process the log file and create tab-separated output"""
+def parse_batches(batches: Iterable[Tuple[int, int, List[LogEvent]]], batch_start_num: int, workers: int) -> Iterator[Tuple[int, int, int, int, Optional[List[Tuple]]]]:
+    """Parse batches across worker processes, yielding results in log order
     
-    with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    Batches with < 5 searches are not parsed and yield None for their rows; the
+    rest are numbered consecutively from batch_start_num. At most 2 * workers batches
+    are in flight at a time, so memory stays bounded on long logs.
     
-    # Find all batch boundaries
-    batches = find_batch_boundaries(lines)
-    
-    if not batches:
-        print("Could not find any complete batch runs")
-        return
+    Args:
+        batches: (start, end, events) tuples from iter_batches
+        batch_start_num: Number for the first batch with at least 5 searches
+        workers: Number of worker processes; 1 parses in this process
     
-    print(f"Found {len(batches)} batch run(s)")
+    Returns:
+        Iterator of (batch number, start, end, search count, rows)
+    """
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    in_flight = deque()
+    batch_num = batch_start_num
+    valid_num = batch_start_num
+    try:
+        for start_idx, end_idx, batch_events in batches:
+            search_count = count_searches(batch_events)
+            if search_count < 5:
+                result = None
+            elif executor is None:
+                result = process_batch(batch_events, valid_num)
+            else:
+                result = executor.submit(process_batch, batch_events, valid_num)
+            if search_count >= 5:
+                valid_num += 1
+            in_flight.append((batch_num, start_idx, end_idx, search_count, result))
+            batch_num += 1
+            
+            while in_flight and (len(in_flight) > 2 * workers or executor is None):
+                yield _finish_batch(in_flight.popleft())
+        while in_flight:
+            yield _finish_batch(in_flight.popleft())
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+def _finish_batch(item: Tuple) -> Tuple[int, int, int, int, Optional[List[Tuple]]]:
+    """Wait for a batch submitted by parse_batches, if it was submitted"""
+    batch_num, start_idx, end_idx, search_count, result = item
+    if result is not None and not isinstance(result, list):
+        result = result.result()
+    return batch_num, start_idx, end_idx, search_count, result
+
+def process_log_file(input_file: str, output_file: str, batch_start_num: int = 1, workers: int = 1):
+    """Process the log file and create tab-separated output
     
-    # Process all batches
-    all_queries = []
-    batch_summaries = []
-    for i, (start_idx, end_idx) in enumerate(batches):
-        batch_num = i + batch_start_num
-        batch_queries = process_batch(lines, start_idx, end_idx, batch_num)
-        all_queries.extend(batch_queries)
-        
-        # Store batch summary for filtering
-        total_found = sum(q['found_jobs'] for q in batch_queries)
-        total_new = sum(q['new_jobs'] for q in batch_queries)
-        batch_summaries.append({
-            'original_batch': batch_num,
-            'queries': batch_queries,
-            'search_count': len(batch_queries),
-            'total_found': total_found,
-            'total_new': total_new
-        })
+    The log is memory-mapped and scanned for marker lines one batch at a time. Searches
+    are counted first, so only batches with at least 5 of them are parsed and written.
+    With workers > 1 the batches are parsed across that many processes; the default
+    parses them in this process, which avoids the pool start-up cost on small logs.
+    """
+    batch_count = 0
+    valid_batches = []
+    query_count = 0
+    out = None
     
-    # Filter out batches with < 5 searches
-    valid_batches = [b for b in batch_summaries if b['search_count'] >= 5]
+    try:
+        with open(input_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                print("Could not find any complete batch runs")  # mmap cannot map an empty file
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                batches = iter_batches(iter_log_events(mm), count_lines(mm))
+                parsed = parse_batches(batches, batch_start_num, workers)
+                for batch_num, start_idx, end_idx, search_count, batch_rows in parsed:
+                    batch_count += 1
+                    
+                    # Batches with < 5 searches are skipped without being parsed
+                    if batch_rows is None:
+                        print(f"\nSkipping Batch {batch_num} (lines {start_idx} to {end_idx}): {search_count} search(es)")
+                        continue
+                    
+                    print(f"\nProcessing Batch {batch_rows[0][0]} (lines {start_idx} to {end_idx})")
+                    for row in batch_rows:
+                        print(f"  Processed: {row[_NAME_COL]} ({row[_FOUND_COL]} found, {row[_NEW_COL]} new)")
+                    
+                    # Write to tab-separated file, created with the first valid batch
+                    if out is None:
+                        out = open(output_file, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+                        writer = csv.writer(out, delimiter='\t')
+                        writer.writerow(QUERY_FIELDS)
+                    writer.writerows(batch_rows)
+                    query_count += len(batch_rows)
+                    
+                    # Store batch summary for the report
+                    valid_batches.append({
+                        'search_count': len(batch_rows),
+                        'total_found': sum(row[_FOUND_COL] for row in batch_rows),
+                        'total_new': sum(row[_NEW_COL] for row in batch_rows)
+                    })
+    finally:
+        if out is not None:
+            out.close()
     
-    print(f"Filtered out {len(batch_summaries) - len(valid_batches)} batch(es) with < 5 searches")
+    if not batch_count:
+        print("Could not find any complete batch runs")
+        return
     
-    # Renumber remaining batches and collect queries
-    filtered_queries = []
-    for new_batch_num, batch_summary in enumerate(valid_batches, start=batch_start_num):
-        # Update batch numbers in the queries
-        for query in batch_summary['queries']:
-            query['batch'] = new_batch_num
-        filtered_queries.extend(batch_summary['queries'])
+    print(f"\nFound {batch_count} batch run(s)")
+    print(f"Filtered out {batch_count - len(valid_batches)} batch(es) with < 5 searches")
     
-    # Write to tab-separated file
-    if filtered_queries:
-        fieldnames = [
-            'batch', 'start_timestamp', 'end_timestamp', 'found_jobs', 'new_jobs',
-            'name', 'enabled', 'site_name', 'search_term', 'location',
-            'is_remote', 'hours_old', 'results_wanted', 'country_indeed',
-            'linkedin_fetch_description', 'google_search_term', 'description_format',
-            'enforce_annual_salary', 'verbose', 'distance'
-        ]
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter='\t')
-            writer.writeheader()
-            writer.writerows(filtered_queries)
-        
-        print(f"\nSuccessfully processed {len(filtered_queries)} queries across {len(valid_batches)} batch(es)")
+    if valid_batches:
+        print(f"\nSuccessfully processed {query_count} queries across {len(valid_batches)} batch(es)")
         print(f"Output written to: {output_file}")
         
         # Print summary of valid batches only
@@ -261,12 +482,19 @@ def process_log_file(input_file: str, output_file: str, batch_start_num: int = 1
         print("No valid batches found (all had < 5 searches)")
 
 def main():
+    parser = argparse.ArgumentParser(description="Convert job scraper log files into tab-separated format")
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for parsing batches (default: 1, parse in this process)')
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
     input_file = "/Users/jonesy/gitlocal/jobscraps/outputs/logs/jobscraper.log"  # Input log file
     output_file = "/Users/jonesy/gitlocal/jobscraps/outputs/exports/parsed_jobscraper_log.tsv"  # Output tab-separated file 
     batch_start_num = 1  # Change this to start batch numbering from a different number
     
     try:
-        process_log_file(input_file, output_file, batch_start_num)
+        process_log_file(input_file, output_file, batch_start_num, args.workers)
     except FileNotFoundError:
         print(f"Error: Could not find input file '{input_file}'")
         print("Please make sure the log file is in the same directory as this script")
@@ -5,12 +5,15 @@
 # Shows which jobs would be deleted based on patterns in delete_titles_test.txt
 
 import os
+import re
 import sys
 import csv
+import bisect
 import pandas as pd
 import argparse
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict, Tuple
 
 # Add parent directory to path to import from scraper.py
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -20,6 +23,251 @@ sys.path.insert(0, PARENT_DIR)
 # Import classes from scraper.py
 from scraper import DatabaseConfig, JobDatabase
 
+# pyahocorasick is optional; without it contains patterns are matched one at a time
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# pyarrow is optional; without it previews are written through pandas' csv writer
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Rows fetched per round trip when streaming preview matches from the server
+PREVIEW_FETCH_SIZE = 2000
+
+# Stand-in for a missing company name; these jobs are left out of company rankings
+NO_COMPANY = '(No Company Listed)'
+
+# Characters with special meaning in a PostgreSQL LIKE pattern (backslash is the default escape)
+LIKE_SPECIAL_CHARS = ('%', '_', '\\')
+
+
+def _normalize_pattern(pattern: str) -> str:
+    """Lowercase a LIKE pattern, trim it, and collapse runs of % into one.
+    
+    Escaped characters (backslash plus the next character) are kept as they are, so
+    an escaped % is never merged into a wildcard run.
+    """
+    parts = []
+    chars = iter(pattern.strip().lower())
+    for char in chars:
+        if char == '%' and parts and parts[-1] == '%':
+            continue
+        if char == '\\':
+            char += next(chars, '')
+        parts.append(char)
+    return ''.join(parts)
+
+
+def _warn_match_all(patterns: List[str]) -> None:
+    """Warn about patterns that match every title once normalized."""
+    for pattern in patterns:
+        if _normalize_pattern(pattern) == '%':
+            print(f"⚠️  Pattern '{pattern}' matches every job title")
+
+
+def _classify_pattern(pattern: str) -> Tuple[str, str]:
+    """Classify a LIKE pattern by the kind of match it needs.
+    
+    Args:
+        pattern: Lowercased LIKE pattern
+        
+    Returns:
+        Tuple of (kind, text): 'exact', 'prefix' ('abc%'), 'suffix' ('%abc') or
+        'contains' ('%abc%') with the pattern's literal text, or 'generic' with the
+        pattern itself for anything that needs the full LIKE semantics
+    """
+    if len(pattern) >= 2 and pattern.startswith('%') and pattern.endswith('%'):
+        kind, text = 'contains', pattern[1:-1]
+    elif pattern.startswith('%'):
+        kind, text = 'suffix', pattern[1:]
+    elif pattern.endswith('%'):
+        kind, text = 'prefix', pattern[:-1]
+    else:
+        kind, text = 'exact', pattern
+    
+    if any(char in text for char in LIKE_SPECIAL_CHARS):
+        return 'generic', pattern
+    return kind, text
+
+
+def _like_to_regex(pattern: str) -> 're.Pattern':
+    """Compile a LIKE pattern (% and _ wildcards, backslash escape) to an equivalent regex."""
+    parts = []
+    chars = iter(pattern)
+    for char in chars:
+        if char == '%':
+            parts.append('.*')
+        elif char == '_':
+            parts.append('.')
+        elif char == '\\':
+            parts.append(re.escape(next(chars, '\\')))
+        else:
+            parts.append(re.escape(char))
+    return re.compile(''.join(parts), re.DOTALL)
+
+
+def _compile_like(pattern: str) -> Callable[[str], bool]:
+    """Compile a LIKE pattern into a match function that rejects too-short values early.
+    
+    The pattern is parsed once into the literal segments between its % wildcards. Values
+    shorter than the segments' combined length are rejected without further work; the
+    rest are checked with startswith/endswith on the outer segments and an in-order
+    str.find walk over the inner ones. Patterns using _ fall back to a regex, with any
+    outer % wildcards handled by choosing re.match or re.search over the rest of the
+    pattern rather than compiled into a .* the regex engine has to backtrack through.
+    """
+    segments = ['']
+    min_len = 0
+    has_underscore = False
+    chars = iter(pattern)
+    for char in chars:
+        if char == '%':
+            segments.append('')
+            continue
+        if char == '_':
+            has_underscore = True
+        elif char == '\\':
+            char = next(chars, '\\')
+        segments[-1] += char
+        min_len += 1
+    
+    if has_underscore:
+        leading = len(segments) > 1 and not segments[0]
+        trailing = 0
+        while trailing < len(segments) - 1 and not segments[-1 - trailing]:
+            trailing += 1
+        body = pattern.lstrip('%') if leading else pattern
+        regex = _like_to_regex(body[:len(body) - trailing])
+        if not leading:
+            search = regex.match if trailing else regex.fullmatch
+        elif trailing:
+            search = regex.search
+        else:
+            search = re.compile(regex.pattern + r'\Z', re.DOTALL).search
+        return lambda value: len(value) >= min_len and search(value) is not None
+    
+    if len(segments) == 1:
+        text = segments[0]
+        return lambda value: value == text
+    
+    first, middle, last = segments[0], segments[1:-1], segments[-1]
+    
+    def match(value: str) -> bool:
+        if len(value) < min_len or not value.startswith(first) or not value.endswith(last):
+            return False
+        pos, end = len(first), len(value) - len(last)
+        for segment in middle:
+            pos = value.find(segment, pos, end)
+            if pos < 0:
+                return False
+            pos += len(segment)
+        return True
+    
+    return match
+
+
+def _prefix_range(sorted_texts: List[str], prefix: str) -> Tuple[int, int]:
+    """Return the [lo, hi) slice of sorted_texts holding the strings that start with prefix."""
+    lo = bisect.bisect_left(sorted_texts, prefix)
+    if not prefix:
+        return lo, len(sorted_texts)
+    if prefix[-1] == chr(sys.maxunicode):
+        hi = lo
+        while hi < len(sorted_texts) and sorted_texts[hi].startswith(prefix):
+            hi += 1
+        return lo, hi
+    # Every string starting with prefix sorts below prefix with its last character bumped
+    return lo, bisect.bisect_left(sorted_texts, prefix[:-1] + chr(ord(prefix[-1]) + 1), lo)
+
+
+def _match_patterns(values: pd.Series, patterns: List[str]) -> List[List[int]]:
+    """Match LIKE patterns case-insensitively against a column in one pass per kind.
+    
+    The column is lowercased once and each distinct normalized pattern is matched
+    once. Exact patterns are dict lookups, prefix and suffix
+    patterns are binary searches over the sorted (or sorted reversed) values, contains
+    patterns share one Aho-Corasick pass when pyahocorasick is installed, and any other
+    pattern is matched with the segment matcher from _compile_like.
+    
+    Args:
+        values: Column to match; missing values match as empty strings
+        patterns: LIKE patterns
+        
+    Returns:
+        For each pattern, the ascending positions of the values it matches
+    """
+    texts = values.fillna('').str.lower().tolist()
+    matches = [[] for _ in patterns]
+    by_kind = {'exact': [], 'prefix': [], 'suffix': [], 'contains': [], 'generic': []}
+    first_index = {}  # Normalized pattern -> index of its first occurrence
+    duplicates = []
+    for i, pattern in enumerate(patterns):
+        normalized = _normalize_pattern(pattern)
+        if normalized in first_index:
+            duplicates.append((i, first_index[normalized]))
+            continue
+        first_index[normalized] = i
+        kind, text = _classify_pattern(normalized)
+        by_kind[kind].append((i, text))
+    
+    if by_kind['exact']:
+        positions_by_text = {}
+        for pos, text in enumerate(texts):
+            positions_by_text.setdefault(text, []).append(pos)
+        for i, text in by_kind['exact']:
+            matches[i] = positions_by_text.get(text, [])
+    
+    for kind in ('prefix', 'suffix'):
+        if not by_kind[kind]:
+            continue
+        keys = texts if kind == 'prefix' else [text[::-1] for text in texts]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        sorted_keys = [keys[pos] for pos in order]
+        for i, text in by_kind[kind]:
+            lo, hi = _prefix_range(sorted_keys, text if kind == 'prefix' else text[::-1])
+            matches[i] = sorted(order[lo:hi])
+    
+    if by_kind['contains']:
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            empty = []
+            for i, text in by_kind['contains']:
+                if not text:
+                    empty.append(i)  # '%%' matches everything; the automaton cannot hold ''
+                elif text in automaton:
+                    automaton.get(text).append(i)
+                else:
+                    automaton.add_word(text, [i])
+            if len(automaton):
+                automaton.make_automaton()
+                for pos, text in enumerate(texts):
+                    hits = set()
+                    for _, pattern_indexes in automaton.iter(text):
+                        hits.update(pattern_indexes)
+                    for i in hits:
+                        matches[i].append(pos)
+            for i in empty:
+                matches[i] = list(range(len(texts)))
+        else:
+            for i, text in by_kind['contains']:
+                matches[i] = [pos for pos, value in enumerate(texts) if text in value]
+    
+    for i, pattern in by_kind['generic']:
+        match = _compile_like(pattern)
+        matches[i] = [pos for pos, value in enumerate(texts) if match(value)]
+    
+    # Duplicate patterns share their first occurrence's result
+    for i, first in duplicates:
+        matches[i] = matches[first]
+    
+    return matches
+
 
 class TitleDeletionPreview:
     """Preview title-based job deletions without actually deleting anything."""
@@ -33,8 +281,47 @@ class TitleDeletionPreview:
         if db_config_path is None:
             db_config_path = os.path.join(PARENT_DIR, "configs", "db_config.json")
         self.db = JobDatabase(db_config_path, "production")
+        # Depth of nested _read_only_transaction blocks; only the outermost one begins and ends
+        self._snapshot_depth = 0
         print(f"✓ Connected to production database for preview")
     
+    @contextmanager
+    def _read_only_transaction(self):
+        """Run the enclosed queries in one read-only REPEATABLE READ transaction.
+        
+        Every query inside sees the same snapshot, and the transaction is closed
+        explicitly rather than left idle until the connection is released. A nested
+        block joins the enclosing transaction, so steps that run their own blocks can
+        still share one snapshot.
+        
+        Yields:
+            The database connection
+        """
+        if self._snapshot_depth:
+            self._snapshot_depth += 1
+            try:
+                yield self.db.conn
+            finally:
+                self._snapshot_depth -= 1
+            return
+        
+        self.db._ensure_connection()
+        conn = self.db.conn
+        
+        # Session characteristics can only change between transactions
+        conn.rollback()
+        conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+        self._snapshot_depth = 1
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._snapshot_depth = 0
+            conn.set_session(isolation_level='DEFAULT', readonly='DEFAULT')
+    
     def preview_title_deletions(self, patterns_file: str = None):
         """Preview which jobs would be deleted by title patterns.
         
@@ -59,52 +346,129 @@ class TitleDeletionPreview:
             return pd.DataFrame(), []
         
         print(f"📋 Found {len(patterns)} patterns to check")
+        _warn_match_all(patterns)
         print("🔍 Scanning database for matches...")
         
-        # Collect all matches and track patterns with no matches
-        all_matches = []
-        patterns_with_matches = 0
+        # Patterns are normalized (lowercased for case-insensitive matching, % runs collapsed)
+        # and each distinct normalized pattern is checked once
+        distinct_patterns = []
+        distinct_index = {}
+        pattern_distinct = []  # For each file pattern, the index of its distinct pattern
+        for pattern in patterns:
+            normalized = _normalize_pattern(pattern)
+            if normalized not in distinct_index:
+                distinct_index[normalized] = len(distinct_patterns)
+                distinct_patterns.append(normalized)
+            pattern_distinct.append(distinct_index[normalized])
+        kinds = [_classify_pattern(pattern) for pattern in distinct_patterns]
+        
+        # A prefix pattern under a shorter one ('senior engineer manager%' under 'senior
+        # engineer%') is not queried; its rows are filtered from the shorter pattern's rows on
+        # PostgreSQL's LOWER(title), which can differ from Python's str.lower() (e.g. for 'İ').
+        # Shortest first, so every covering prefix is seen before the patterns it covers
+        covering_prefixes = {}  # Prefix text -> distinct index
+        covered_by = {}  # Distinct index -> (covering distinct index, prefix text)
+        for i, (kind, text) in sorted(enumerate(kinds), key=lambda item: len(item[1][1])):
+            if kind != 'prefix':
+                continue
+            parent = next((covering_prefixes[text[:k]] for k in range(len(text)) if text[:k] in covering_prefixes), None)
+            if parent is None:
+                covering_prefixes[text] = i
+            else:
+                covered_by[i] = (parent, text)
+        
+        skipped = len(patterns) - len(distinct_patterns) + len(covered_by)
+        if skipped:
+            print(f"   Skipping {skipped} duplicate or prefix-covered patterns in the query")
+        
+        # Wildcard-free patterns are compared with = and the rest with LIKE (the LOWER(title)
+        # indexes serve prefixes and, through pg_trgm, contains/suffix patterns); ord is the
+        # distinct pattern's position, in file order
+        exact_patterns, exact_ords, like_patterns, like_ords = [], [], [], []
+        for i, (pattern, (kind, _)) in enumerate(zip(distinct_patterns, kinds)):
+            if i in covered_by:
+                continue
+            if kind == 'exact':
+                exact_patterns.append(pattern)
+                exact_ords.append(i + 1)
+            else:
+                like_patterns.append(pattern)
+                like_ords.append(i + 1)
+        
+        # One query for all patterns: rows come back grouped by pattern (in file order) and by
+        # title, company within each pattern, as the old one-query-per-pattern loop returned them
+        query = """
+        SELECT e.ord, LOWER(j.title), j.id, j.title, j.company, j.search_query, j.job_url
+        FROM unnest(%(exact_patterns)s::text[], %(exact_ords)s::int[]) AS e(pat, ord)
+        JOIN scraped_jobs j ON LOWER(j.title) = e.pat
+        UNION ALL
+        SELECT l.ord, LOWER(j.title), j.id, j.title, j.company, j.search_query, j.job_url
+        FROM unnest(%(like_patterns)s::text[], %(like_ords)s::int[]) AS l(pat, ord)
+        JOIN scraped_jobs j ON LOWER(j.title) LIKE l.pat
+        ORDER BY ord, title, company
+        """
+        params = {
+            'exact_patterns': exact_patterns,
+            'exact_ords': exact_ords,
+            'like_patterns': like_patterns,
+            'like_ords': like_ords
+        }
+        
+        # Matched rows as (id, title, company, search_query, job_url) per distinct pattern
+        distinct_matches = {}
+        # Lowercased titles of the matched rows, kept only for patterns that cover others
+        covering = {parent for parent, _ in covered_by.values()}
+        covering_titles = {}
+        next_progress = 50
+        
+        # Named (server-side) cursor so matches stream in PREVIEW_FETCH_SIZE batches
+        with self._read_only_transaction() as conn, conn.cursor('title_deletion_preview') as cursor:
+            cursor.itersize = PREVIEW_FETCH_SIZE
+            cursor.execute(query, params)
+            for ord_, title_lower, *match in cursor:
+                # Every pattern before this one has been fully checked
+                while next_progress < ord_:
+                    print(f"   Progress: {next_progress}/{len(distinct_patterns)} patterns checked")
+                    next_progress += 50
+                distinct_matches.setdefault(ord_ - 1, []).append(match)
+                if ord_ - 1 in covering:
+                    covering_titles.setdefault(ord_ - 1, []).append(title_lower)
+        
+        while next_progress < len(distinct_patterns):
+            print(f"   Progress: {next_progress}/{len(distinct_patterns)} patterns checked")
+            next_progress += 50
+        print(f"   Progress: {len(distinct_patterns)}/{len(distinct_patterns)} patterns checked")
+        
+        for i, (parent, text) in covered_by.items():
+            rows = [
+                match for match, title_lower in zip(distinct_matches.get(parent, []), covering_titles.get(parent, []))
+                if title_lower and title_lower.startswith(text)
+            ]
+            if rows:
+                distinct_matches[i] = rows
+        
+        # Report every file pattern, duplicates included, under its original spelling. Matches
+        # are gathered column by column, which builds the DataFrame far faster than row dicts
+        match_columns = ('id', 'title', 'company', 'search_query', 'job_url')
+        all_matches = {'title_match_criteria': []}
+        all_matches.update((column, []) for column in match_columns)
         patterns_with_no_matches = []
+        for pattern, i in zip(patterns, pattern_distinct):
+            if i not in distinct_matches:
+                patterns_with_no_matches.append(pattern)
+                continue
+            rows = distinct_matches[i]
+            all_matches['title_match_criteria'].extend([pattern] * len(rows))
+            for column, values in zip(match_columns, zip(*rows)):
+                all_matches[column].extend(values)
         
-        self.db._ensure_connection()
-        
-        with self.db.conn.cursor() as cursor:
-            for i, pattern in enumerate(patterns, 1):
-                if i % 50 == 0 or i == len(patterns):
-                    print(f"   Progress: {i}/{len(patterns)} patterns checked")
-                
-                # Convert pattern to lowercase for case-insensitive matching
-                pattern_lower = pattern.lower()
-                
-                query = """
-                SELECT id, title, company, search_query, job_url
-                FROM scraped_jobs 
-                WHERE LOWER(title) LIKE %s
-                ORDER BY title, company
-                """
-                
-                cursor.execute(query, (pattern_lower,))
-                matches = cursor.fetchall()
-                
-                if matches:
-                    patterns_with_matches += 1
-                    for match in matches:
-                        all_matches.append({
-                            'title_match_criteria': pattern,
-                            'id': match[0],
-                            'title': match[1],
-                            'company': match[2],
-                            'search_query': match[3],
-                            'job_url': match[4]
-                        })
-                else:
-                    patterns_with_no_matches.append(pattern)
+        patterns_with_matches = len(patterns) - len(patterns_with_no_matches)
         
         # Convert to DataFrame and create summary
-        if all_matches:
+        if all_matches['id']:
             df = pd.DataFrame(all_matches)
             
-            total_matches = len(all_matches)
+            total_matches = len(df)
             unique_jobs = df['id'].nunique()
             
             print(f"\n📊 PREVIEW SUMMARY:")
@@ -119,14 +483,14 @@ class TitleDeletionPreview:
             return pd.DataFrame(), patterns_with_no_matches
     
     def save_preview_to_csv(self, df: pd.DataFrame, filename: str = None) -> str:
-        """Save preview results to CSV file.
+        """Save preview results to CSV file, or Parquet when filename ends in .parquet.
         
         Args:
             df: DataFrame with preview results
             filename: Optional filename, will generate timestamp-based name if not provided
             
         Returns:
-            Path to saved CSV file
+            Path to saved file
         """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -139,10 +503,53 @@ class TitleDeletionPreview:
         # Sort by title for easier review
         df_sorted = df.sort_values(['title', 'company', 'title_match_criteria'])
         
-        df_sorted.to_csv(filename, index=False, quoting=csv.QUOTE_ALL)
+        if filename.lower().endswith('.parquet'):
+            if pa is None:
+                raise RuntimeError("Writing Parquet previews requires pyarrow (pip install pyarrow)")
+            pq.write_table(pa.Table.from_pandas(df_sorted, preserve_index=False), filename)
+        elif pa is not None:
+            # Arrow quotes and encodes whole columns in C++ rather than row by row in Python
+            table = pa.Table.from_pandas(df_sorted, preserve_index=False)
+            pacsv.write_csv(table, filename,
+                            write_options=pacsv.WriteOptions(quoting_style='all_valid'))
+        else:
+            df_sorted.to_csv(filename, index=False, quoting=csv.QUOTE_ALL)
         print(f"💾 Preview saved to: {filename}")
         return filename
     
+    def compute_preview_stats(self, df: pd.DataFrame) -> Dict:
+        """Compute the aggregates the analysis reports share, once per preview.
+        
+        Args:
+            df: Non-empty DataFrame with preview results
+            
+        Returns:
+            Dict with unique_jobs, pattern_counts (matches per pattern), company_counts
+            (unique jobs per named company), excluded_count (unique jobs with no company),
+            query_counts (unique jobs per search query), and per-pattern
+            pattern_company_counts and pattern_excluded_counts
+        """
+        # One categorical company column replaces a fillna'd copy of the frame per report
+        companies = pd.Categorical(df['company'].fillna(NO_COMPANY))
+        has_company = companies != NO_COMPANY
+        by_company = pd.DataFrame({
+            'pattern': df['title_match_criteria'].to_numpy(),
+            'company': companies,
+            'id': df['id'].to_numpy()
+        })
+        named = by_company[has_company]
+        unnamed = by_company[~has_company]
+        
+        return {
+            'unique_jobs': df['id'].nunique(),
+            'pattern_counts': df['title_match_criteria'].value_counts(),
+            'company_counts': named.groupby('company', observed=True)['id'].nunique().sort_values(ascending=False),
+            'excluded_count': unnamed['id'].nunique(),
+            'query_counts': df.groupby(df['search_query'].fillna('(No Search Query)'))['id'].nunique().sort_values(ascending=False),
+            'pattern_company_counts': named.groupby(['pattern', 'company'], observed=True)['id'].nunique(),
+            'pattern_excluded_counts': unnamed.groupby('pattern')['id'].nunique()
+        }
+    
     def show_patterns_with_no_matches(self, patterns_with_no_matches: List[str]) -> None:
         """Show all patterns that had zero matches.
         
@@ -160,12 +567,13 @@ class TitleDeletionPreview:
         for pattern in sorted(patterns_with_no_matches):
             print(f"  {pattern}")
     
-    def analyze_pattern_overlap(self, df: pd.DataFrame, top_n: int = 15) -> None:
+    def analyze_pattern_overlap(self, df: pd.DataFrame, top_n: int = 15, stats: Dict = None) -> None:
         """Analyze which pairs of patterns have the most overlapping job IDs.
         
         Args:
             df: DataFrame with preview results
             top_n: Number of top overlapping pairs to show
+            stats: Aggregates from compute_preview_stats, computed here if not given
         """
         if df.empty:
             print("No data to analyze for pattern overlap")
@@ -174,84 +582,93 @@ class TitleDeletionPreview:
         print(f"\n🔄 PATTERN OVERLAP ANALYSIS:")
         print("Finding pairs of patterns that match the same jobs...")
         
-        # Get patterns that have matches
-        patterns_with_jobs = df['title_match_criteria'].unique()
+        # Get patterns that have matches, coded in order of first appearance
+        pattern_codes, patterns_with_jobs = pd.factorize(df['title_match_criteria'])
         
         if len(patterns_with_jobs) < 2:
             print("Not enough patterns with matches to analyze overlap")
             return
         
-        # Create a mapping of pattern -> set of job IDs and get pattern job counts
-        pattern_jobs = {}
-        pattern_counts = df['title_match_criteria'].value_counts()
-        
-        for pattern in patterns_with_jobs:
-            pattern_jobs[pattern] = set(df[df['title_match_criteria'] == pattern]['id'].unique())
+        pattern_counts = (stats or self.compute_preview_stats(df))['pattern_counts']
         
-        # Find overlaps between all pairs
-        overlaps = []
-        patterns_list = list(patterns_with_jobs)
+        # One row per (pattern, job), both as compact integer codes; joining that on job id
+        # yields every pair of patterns sharing a job, so each pair's overlap is its row count
+        job_codes, _ = pd.factorize(df['id'])
+        pattern_ids = pd.DataFrame({
+            'code': pattern_codes.astype('int32'),
+            'job': job_codes.astype('int32')
+        }).drop_duplicates()
+        pairs = pattern_ids.merge(pattern_ids, on='job', suffixes=('_a', '_b'))
+        pairs = pairs[pairs['code_a'] < pairs['code_b']]
         
-        for i in range(len(patterns_list)):
-            for j in range(i + 1, len(patterns_list)):
-                pattern_a = patterns_list[i]
-                pattern_b = patterns_list[j]
-                
-                overlap_count = len(pattern_jobs[pattern_a] & pattern_jobs[pattern_b])
-                
-                if overlap_count > 0:
-                    # Ensure pattern1 is the one with more jobs (more impactful)
-                    count_a = pattern_counts[pattern_a]
-                    count_b = pattern_counts[pattern_b]
-                    
-                    if count_a >= count_b:
-                        pattern1, pattern2 = pattern_a, pattern_b
-                        pattern1_total, pattern2_total = count_a, count_b
-                    else:
-                        pattern1, pattern2 = pattern_b, pattern_a
-                        pattern1_total, pattern2_total = count_b, count_a
-                    
-                    overlaps.append({
-                        'pattern1': pattern1,
-                        'pattern2': pattern2,
-                        'overlap_count': overlap_count,
-                        'pattern1_total': pattern1_total,
-                        'pattern2_total': pattern2_total
-                    })
-        
-        if not overlaps:
+        if pairs.empty:
             print("No overlapping jobs found between patterns")
             return
         
-        # Sort by overlap count
-        overlaps.sort(key=lambda x: x['overlap_count'], reverse=True)
+        # Count pairs through a single int64 key rather than a two-column groupby. Key order
+        # is the order the old nested loop visited pairs, and the stable sort keeps that
+        # order among equal counts
+        num_patterns = len(patterns_with_jobs)
+        pair_keys = pairs['code_a'].astype('int64') * num_patterns + pairs['code_b']
+        overlap_counts = pair_keys.value_counts(sort=False).sort_index().sort_values(ascending=False, kind='stable')
         
-        print(f"\n🔝 TOP {min(top_n, len(overlaps))} PATTERN PAIRS WITH MOST OVERLAP:")
+        print(f"\n🔝 TOP {min(top_n, len(overlap_counts))} PATTERN PAIRS WITH MOST OVERLAP:")
         print(f"(Pattern 1 = more impactful pattern)")
         print(f"{'Pattern 1 (Higher Impact)':<30} {'Pattern 2':<25} {'Overlap':<8} {'% of P1':<8} {'% of P2':<8}")
         print("-" * 95)
         
-        for overlap in overlaps[:top_n]:
-            p1_percent = (overlap['overlap_count'] / overlap['pattern1_total']) * 100
-            p2_percent = (overlap['overlap_count'] / overlap['pattern2_total']) * 100
+        for pair_key, overlap_count in overlap_counts.head(top_n).items():
+            code_a, code_b = divmod(pair_key, num_patterns)
+            pattern_a = patterns_with_jobs[code_a]
+            pattern_b = patterns_with_jobs[code_b]
+            
+            # Ensure pattern1 is the one with more jobs (more impactful)
+            count_a = pattern_counts[pattern_a]
+            count_b = pattern_counts[pattern_b]
+            
+            if count_a >= count_b:
+                pattern1, pattern2 = pattern_a, pattern_b
+                pattern1_total, pattern2_total = count_a, count_b
+            else:
+                pattern1, pattern2 = pattern_b, pattern_a
+                pattern1_total, pattern2_total = count_b, count_a
+            
+            p1_percent = (overlap_count / pattern1_total) * 100
+            p2_percent = (overlap_count / pattern2_total) * 100
             
-            p1_display = overlap['pattern1'][:27] + "..." if len(overlap['pattern1']) > 30 else overlap['pattern1']
-            p2_display = overlap['pattern2'][:22] + "..." if len(overlap['pattern2']) > 25 else overlap['pattern2']
+            p1_display = pattern1[:27] + "..." if len(pattern1) > 30 else pattern1
+            p2_display = pattern2[:22] + "..." if len(pattern2) > 25 else pattern2
             
-            print(f"{p1_display:<30} {p2_display:<25} {overlap['overlap_count']:<8} {p1_percent:>6.1f}% {p2_percent:>6.1f}%")
+            print(f"{p1_display:<30} {p2_display:<25} {overlap_count:<8} {p1_percent:>6.1f}% {p2_percent:>6.1f}%")
 
-    def show_pattern_summary_with_companies(self, df: pd.DataFrame, top_n: int = 25) -> None:
+    def show_pattern_summary_with_companies(self, df: pd.DataFrame, top_n: int = 25, stats: Dict = None) -> None:
         """Show summary of patterns with top companies affected by each pattern.
         
         Args:
             df: DataFrame with preview results
             top_n: Number of top patterns to show
+            stats: Aggregates from compute_preview_stats, computed here if not given
         """
         if df.empty:
             print("No data to summarize")
             return
         
-        pattern_counts = df['title_match_criteria'].value_counts()
+        if stats is None:
+            stats = self.compute_preview_stats(df)
+        pattern_counts = stats['pattern_counts']
+        pattern_company_counts = stats['pattern_company_counts']
+        
+        # Rank the companies of every shown pattern in one pass, then look each pattern up by key
+        top_patterns = pattern_counts.head(top_n).index
+        shown_counts = pattern_company_counts[
+            pattern_company_counts.index.get_level_values('pattern').isin(top_patterns)
+        ]
+        top_companies = (shown_counts.sort_values(ascending=False, kind='stable')
+                         .groupby(level='pattern', sort=False).head(5))
+        companies_by_pattern = {
+            pattern: counts.droplevel('pattern')
+            for pattern, counts in top_companies.groupby(level='pattern', sort=False)
+        }
         
         print(f"\n🎯 TOP {min(top_n, len(pattern_counts))} MOST IMPACTFUL PATTERNS WITH COMPANY BREAKDOWN:")
         print("=" * 100)
@@ -259,21 +676,15 @@ class TitleDeletionPreview:
         for i, (pattern, count) in enumerate(pattern_counts.head(top_n).items(), 1):
             print(f"\n{i}. Pattern: '{pattern}' - {count:,} jobs")
             
-            # Get jobs for this pattern and find top companies
-            pattern_jobs = df[df['title_match_criteria'] == pattern].copy()
-            pattern_jobs['company'] = pattern_jobs['company'].fillna('(No Company Listed)')
-            
-            # Filter out jobs with no company for ranking purposes
-            pattern_jobs_filtered = pattern_jobs[pattern_jobs['company'] != '(No Company Listed)']
-            
-            if pattern_jobs_filtered.empty:
+            # Jobs with no company are left out of the ranking
+            if pattern not in companies_by_pattern:
                 print(f"   No companies with names found for this pattern (all jobs missing company data)")
                 continue
             
-            company_counts = pattern_jobs_filtered.groupby('company')['id'].nunique().sort_values(ascending=False)
+            company_counts = companies_by_pattern[pattern]
             
             # Show how many jobs were excluded for this pattern
-            excluded_count = pattern_jobs[pattern_jobs['company'] == '(No Company Listed)']['id'].nunique()
+            excluded_count = stats['pattern_excluded_counts'].get(pattern, 0)
             
             print(f"   TOP 5 COMPANIES AFFECTED BY THIS PATTERN:")
             if excluded_count > 0:
@@ -281,7 +692,7 @@ class TitleDeletionPreview:
             print(f"   {'Company':<45} {'Jobs':<8}")
             print(f"   {'-' * 53}")
             
-            for company, job_count in company_counts.head(5).items():
+            for company, job_count in company_counts.items():
                 company_display = company[:42] + "..." if len(company) > 45 else company
                 print(f"   {company_display:<45} {job_count:<8}")
         
@@ -290,33 +701,30 @@ class TitleDeletionPreview:
             total_remaining = pattern_counts.tail(remaining).sum()
             print(f"\n... and {remaining} more patterns with {total_remaining:,} total jobs")
     
-    def show_top_companies_affected(self, df: pd.DataFrame, top_n: int = 20) -> None:
+    def show_top_companies_affected(self, df: pd.DataFrame, top_n: int = 20, stats: Dict = None) -> None:
         """Show which companies would be most affected.
         
         Args:
             df: DataFrame with preview results
             top_n: Number of top companies to show
+            stats: Aggregates from compute_preview_stats, computed here if not given
         """
         if df.empty:
             print("No data to analyze")
             return
         
-        # Handle NULL company names and exclude "(No Company Listed)" from rankings
-        df_companies = df.copy()
-        df_companies['company'] = df_companies['company'].fillna('(No Company Listed)')
+        if stats is None:
+            stats = self.compute_preview_stats(df)
         
-        # Filter out jobs with no company for ranking purposes
-        df_companies_filtered = df_companies[df_companies['company'] != '(No Company Listed)']
+        # Unique jobs per company (not total matches), with jobs that have no company left out
+        company_counts = stats['company_counts']
         
-        if df_companies_filtered.empty:
+        if company_counts.empty:
             print("\n🏢 No companies with names found - all jobs have missing company data")
             return
         
-        # Count unique jobs per company (not total matches)
-        company_counts = df_companies_filtered.groupby('company')['id'].nunique().sort_values(ascending=False)
-        
         # Show how many jobs were excluded
-        excluded_count = df_companies[df_companies['company'] == '(No Company Listed)']['id'].nunique()
+        excluded_count = stats['excluded_count']
         
         print(f"\n🏢 TOP {min(top_n, len(company_counts))} COMPANIES AFFECTED:")
         if excluded_count > 0:
@@ -333,22 +741,20 @@ class TitleDeletionPreview:
             remaining_jobs = company_counts.tail(remaining_companies).sum()
             print(f"{'... and ' + str(remaining_companies) + ' more companies':<50} {remaining_jobs:<15}")
     
-    def show_search_query_breakdown(self, df: pd.DataFrame, top_n: int = 15) -> None:
+    def show_search_query_breakdown(self, df: pd.DataFrame, top_n: int = 15, stats: Dict = None) -> None:
         """Show which search queries would be most affected.
         
         Args:
             df: DataFrame with preview results
             top_n: Number of top search queries to show
+            stats: Aggregates from compute_preview_stats, computed here if not given
         """
         if df.empty:
             print("No data to analyze")
             return
         
-        # Handle NULL search query names
-        df_queries = df.copy()
-        df_queries['search_query'] = df_queries['search_query'].fillna('(No Search Query)')
-        
-        query_counts = df_queries.groupby('search_query')['id'].nunique().sort_values(ascending=False)
+        # Unique jobs per search query, with NULL queries grouped under one name
+        query_counts = (stats or self.compute_preview_stats(df))['query_counts']
         
         print(f"\n🔍 TOP {min(top_n, len(query_counts))} SEARCH QUERIES AFFECTED:")
         print(f"{'Search Query':<40} {'Jobs to Delete':<15}")
@@ -358,21 +764,29 @@ class TitleDeletionPreview:
             query_display = query[:37] + "..." if len(query) > 40 else query
             print(f"{query_display:<40} {count:<15}")
     
-    def show_sample_jobs(self, df: pd.DataFrame, sample_size: int = 10) -> None:
+    def show_sample_jobs(self, df: pd.DataFrame, sample_size: int = 10, stats: Dict = None) -> None:
         """Show sample of jobs that would be deleted.
         
         Args:
             df: DataFrame with preview results
             sample_size: Number of sample jobs to show
+            stats: Aggregates from compute_preview_stats, computed here if not given
         """
         if df.empty:
             print("No data to show")
             return
         
-        # Get unique jobs only
-        unique_jobs = df.drop_duplicates(subset=['id']).head(sample_size)
-        
-        print(f"\n👀 SAMPLE OF JOBS TO BE DELETED (showing {len(unique_jobs)} of {df['id'].nunique()}):")
+        # Take the first sample_size unique jobs, reading ids only until enough are found
+        # rather than deduplicating the whole frame
+        first_positions = {}
+        for pos, job_id in enumerate(df['id']):
+            if len(first_positions) >= sample_size:
+                break
+            first_positions.setdefault(job_id, pos)
+        unique_jobs = df.iloc[list(first_positions.values())]
+        
+        total_unique = stats['unique_jobs'] if stats else df['id'].nunique()
+        print(f"\n👀 SAMPLE OF JOBS TO BE DELETED (showing {len(unique_jobs)} of {total_unique}):")
         print("-" * 100)
         
         for idx, job in unique_jobs.iterrows():
@@ -389,7 +803,8 @@ class TitleDeletionPreview:
             companies_file: Path to file containing company patterns
             
         Returns:
-            DataFrame with jobs that would remain after company deletion
+            DataFrame with the id, title, company and search_query of the jobs that
+            would remain after company deletion
         """
         if companies_file is None:
             companies_file = os.path.join(PARENT_DIR, "configs", "delete_companies_test.txt")
@@ -409,81 +824,48 @@ class TitleDeletionPreview:
             print(f"🏢 Found {len(company_patterns)} company patterns for simulation")
             print("🔍 Simulating company deletion to get remaining jobs...")
             
-            self.db._ensure_connection()
-            
-            # Get all jobs first
-            all_jobs_query = """
-            SELECT id, title, company, search_query, job_url
-            FROM scraped_jobs 
+            # The company filter runs in the database with the same LIKE ANY match as
+            # delete_jobs_by_field, so only the jobs that would remain are fetched. A NULL
+            # company never matches, hence IS NOT TRUE.
+            params = {'patterns': [_normalize_pattern(pattern) for pattern in company_patterns]}
+            counts_query = """
+            SELECT (SELECT COUNT(*) FROM scraped_jobs),
+                   (SELECT COUNT(*)
+                    FROM unnest(%(patterns)s::text[]) AS p(pat)
+                    WHERE EXISTS (SELECT 1 FROM scraped_jobs j WHERE LOWER(j.company) LIKE p.pat))
+            """
+            remaining_jobs_query = """
+            SELECT id, title, company, search_query
+            FROM scraped_jobs j
+            WHERE (LOWER(j.company) LIKE ANY(%(patterns)s::text[])) IS NOT TRUE
             ORDER BY title, company
             """
             
-            with self.db.conn.cursor() as cursor:
-                cursor.execute(all_jobs_query)
-                all_jobs = cursor.fetchall()
-            
-            if not all_jobs:
-                print("No jobs found in database")
-                return pd.DataFrame()
-            
-            # Convert to DataFrame
-            all_jobs_df = pd.DataFrame(all_jobs, columns=['id', 'title', 'company', 'search_query', 'job_url'])
-            total_jobs = len(all_jobs_df)
-            
-            # Identify jobs that would be deleted by company patterns
-            jobs_to_delete = set()
-            company_pattern_matches = 0
-            
-            for pattern in company_patterns:
-                try:
-                    pattern_lower = pattern.lower()
-                    
-                    # SQL LIKE patterns use % as wildcard, regex uses .*
-                    # Convert SQL pattern to pandas string matching
-                    if pattern_lower.startswith('%') and pattern_lower.endswith('%'):
-                        # %pattern% - contains
-                        search_str = pattern_lower[1:-1]
-                        matching_jobs = all_jobs_df[
-                            all_jobs_df['company'].fillna('').str.lower().str.contains(
-                                search_str, 
-                                regex=False, 
-                                na=False
-                            )
-                        ]['id'].tolist()
-                    elif pattern_lower.startswith('%'):
-                        # %pattern - ends with
-                        search_str = pattern_lower[1:]
-                        matching_jobs = all_jobs_df[
-                            all_jobs_df['company'].fillna('').str.lower().str.endswith(
-                                search_str, 
-                                na=False
-                            )
-                        ]['id'].tolist()
-                    elif pattern_lower.endswith('%'):
-                        # pattern% - starts with
-                        search_str = pattern_lower[:-1]
-                        matching_jobs = all_jobs_df[
-                            all_jobs_df['company'].fillna('').str.lower().str.startswith(
-                                search_str, 
-                                na=False
-                            )
-                        ]['id'].tolist()
-                    else:
-                        # exact match
-                        matching_jobs = all_jobs_df[
-                            all_jobs_df['company'].fillna('').str.lower() == pattern_lower
-                        ]['id'].tolist()
+            # Both queries share one snapshot, so the counts agree with the streamed jobs.
+            # job_url is left out; only matched jobs need it (see _fetch_job_urls)
+            columns = ['id', 'title', 'company', 'search_query']
+            chunks = []
+            with self._read_only_transaction() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(counts_query, params)
+                    total_jobs, company_pattern_matches = cursor.fetchone()
                     
-                    if matching_jobs:
-                        company_pattern_matches += 1
-                        jobs_to_delete.update(matching_jobs)
-                        
-                except Exception as e:
-                    print(f"   Warning: Error processing company pattern '{pattern}': {e}")
-                    continue
+                    if not total_jobs:
+                        print("No jobs found in database")
+                        return pd.DataFrame()
+                
+                # Named (server-side) cursor so the remaining jobs arrive in PREVIEW_FETCH_SIZE
+                # chunks instead of one client-side result set
+                with conn.cursor('remaining_jobs_stream') as cursor:
+                    cursor.itersize = PREVIEW_FETCH_SIZE
+                    cursor.execute(remaining_jobs_query, params)
+                    while True:
+                        rows = cursor.fetchmany(PREVIEW_FETCH_SIZE)
+                        if not rows:
+                            break
+                        chunks.append(pd.DataFrame(rows, columns=columns))
             
-            # Filter out jobs that would be deleted by company patterns
-            remaining_jobs_df = all_jobs_df[~all_jobs_df['id'].isin(jobs_to_delete)]
+            remaining_jobs_df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
             
             jobs_deleted_by_companies = total_jobs - len(remaining_jobs_df)
             
@@ -501,6 +883,19 @@ class TitleDeletionPreview:
             traceback.print_exc()
             return pd.DataFrame()
 
+    def _fetch_job_urls(self, job_ids: List[str]) -> Dict[str, str]:
+        """Look up job_url for the given jobs.
+        
+        Args:
+            job_ids: Ids of the jobs to look up
+            
+        Returns:
+            Dict mapping job id to job_url
+        """
+        with self._read_only_transaction() as conn, conn.cursor() as cursor:
+            cursor.execute("SELECT id, job_url FROM scraped_jobs WHERE id = ANY(%s)", (job_ids,))
+            return dict(cursor.fetchall())
+    
     def preview_title_deletions_with_simulation(self, patterns_file: str, companies_file: str):
         """Preview title deletions after simulating company deletions first.
         
@@ -511,6 +906,12 @@ class TitleDeletionPreview:
         Returns:
             Tuple of (DataFrame with preview results, list of patterns with no matches)
         """
+        # The company simulation and the job_url lookup for its matches read one snapshot
+        with self._read_only_transaction():
+            return self._preview_title_deletions_after_simulation(patterns_file, companies_file)
+    
+    def _preview_title_deletions_after_simulation(self, patterns_file: str, companies_file: str):
+        """Body of preview_title_deletions_with_simulation, run inside its snapshot."""
         print("🎭 SIMULATION MODE: Company deletion → Title deletion")
         print("=" * 70)
         
@@ -536,73 +937,33 @@ class TitleDeletionPreview:
             return pd.DataFrame(), []
         
         print(f"📋 Found {len(patterns)} title patterns to check")
+        _warn_match_all(patterns)
         print("🔍 Scanning remaining jobs for title matches...")
         
-        # Apply title patterns to remaining jobs
-        all_matches = []
-        patterns_with_matches = 0
+        # Apply title patterns to remaining jobs with the same LIKE semantics as delete_jobs_by_field
+        pattern_positions = _match_patterns(remaining_jobs_df['title'], patterns)
+        print(f"   Progress: {len(patterns)}/{len(patterns)} patterns checked")
+        
+        match_positions = []
+        match_criteria = []
         patterns_with_no_matches = []
         
-        for i, pattern in enumerate(patterns, 1):
-            if i % 50 == 0 or i == len(patterns):
-                print(f"   Progress: {i}/{len(patterns)} patterns checked")
-            
-            pattern_lower = pattern.lower()
-            
-            # Find matches in remaining jobs using same logic as delete_jobs_by_field
-            if pattern_lower.startswith('%') and pattern_lower.endswith('%'):
-                # %pattern% - contains
-                search_str = pattern_lower[1:-1]
-                matching_jobs = remaining_jobs_df[
-                    remaining_jobs_df['title'].fillna('').str.lower().str.contains(
-                        search_str,
-                        regex=False,
-                        na=False
-                    )
-                ]
-            elif pattern_lower.startswith('%'):
-                # %pattern - ends with
-                search_str = pattern_lower[1:]
-                matching_jobs = remaining_jobs_df[
-                    remaining_jobs_df['title'].fillna('').str.lower().str.endswith(
-                        search_str,
-                        na=False
-                    )
-                ]
-            elif pattern_lower.endswith('%'):
-                # pattern% - starts with
-                search_str = pattern_lower[:-1]
-                matching_jobs = remaining_jobs_df[
-                    remaining_jobs_df['title'].fillna('').str.lower().str.startswith(
-                        search_str,
-                        na=False
-                    )
-                ]
-            else:
-                # exact match
-                matching_jobs = remaining_jobs_df[
-                    remaining_jobs_df['title'].fillna('').str.lower() == pattern_lower
-                ]
-            
-            if not matching_jobs.empty:
-                patterns_with_matches += 1
-                for _, job in matching_jobs.iterrows():
-                    all_matches.append({
-                        'title_match_criteria': pattern,
-                        'id': job['id'],
-                        'title': job['title'],
-                        'company': job['company'],
-                        'search_query': job['search_query'],
-                        'job_url': job['job_url']
-                    })
+        for pattern, positions in zip(patterns, pattern_positions):
+            if positions:
+                match_positions.extend(positions)
+                match_criteria.extend([pattern] * len(positions))
             else:
                 patterns_with_no_matches.append(pattern)
         
-        # Convert to DataFrame and create summary
-        if all_matches:
-            df = pd.DataFrame(all_matches)
+        patterns_with_matches = len(patterns) - len(patterns_with_no_matches)
+        
+        # Build the matches DataFrame and create summary
+        if match_positions:
+            df = remaining_jobs_df.iloc[match_positions].reset_index(drop=True)
+            df.insert(0, 'title_match_criteria', match_criteria)
+            df['job_url'] = df['id'].map(self._fetch_job_urls(df['id'].unique().tolist()))
             
-            total_matches = len(all_matches)
+            total_matches = len(df)
             unique_jobs = df['id'].nunique()
             
             print(f"\n📊 TITLE DELETION PREVIEW (AFTER COMPANY SIMULATION):")
@@ -644,7 +1005,7 @@ Examples:
     parser.add_argument('--patterns-file', 
                        help=f'Path to file containing title patterns (default: {os.path.join("configs", "delete_titles_test.txt")})')
     parser.add_argument('--output-file', 
-                       help=f'Output CSV filename (default: {os.path.join("outputs", "testing", "title_deletion_preview_[timestamp].csv")})')
+                       help=f'Output CSV filename, or .parquet for a Parquet file (default: {os.path.join("outputs", "testing", "title_deletion_preview_[timestamp].csv")})')
     parser.add_argument('--db-config', 
                        help=f'Path to database configuration file (default: {os.path.join("configs", "db_config.json")})')
     parser.add_argument('--show-analysis', action='store_true',
@@ -685,17 +1046,22 @@ Examples:
             # Save to CSV
             csv_file = preview.save_preview_to_csv(df, args.output_file)
             
+            # The shared aggregates are only needed by the analysis reports
             if args.show_analysis:
-                preview.show_pattern_summary_with_companies(df)
-                preview.show_top_companies_affected(df)
-                preview.show_search_query_breakdown(df)
-                preview.analyze_pattern_overlap(df)
-                preview.show_sample_jobs(df)
+                stats = preview.compute_preview_stats(df)
+                unique_jobs = stats['unique_jobs']
+                preview.show_pattern_summary_with_companies(df, stats=stats)
+                preview.show_top_companies_affected(df, stats=stats)
+                preview.show_search_query_breakdown(df, stats=stats)
+                preview.analyze_pattern_overlap(df, stats=stats)
+                preview.show_sample_jobs(df, stats=stats)
                 preview.show_patterns_with_no_matches(patterns_with_no_matches)
+            else:
+                unique_jobs = df['id'].nunique()
             
             print(f"\n" + "=" * 70)
             print(f"✅ Preview complete! Full results saved to: {csv_file}")
-            print(f"📊 {df['id'].nunique():,} unique jobs would be deleted")
+            print(f"📊 {unique_jobs:,} unique jobs would be deleted")
             if args.simulate_company_deletion:
                 print(f"🎭 This simulation shows title deletion impact AFTER company deletion")
                 print(f"🚀 To proceed (from project root):")
@@ -0,0 +1,73 @@
+"""Tests for the `search` command's full-text index in scripts/cli.py"""
+
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from rich.console import Console
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import cli
+
+
+class SearchIndexTest(unittest.TestCase):
+    """The FTS index must keep pointing at the right jobs across VACUUM"""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        db = sqlite3.connect("jobs.db")
+        db.execute("""
+            CREATE TABLE scraped_jobs (
+                id TEXT PRIMARY KEY, title TEXT, company TEXT, location TEXT,
+                date_posted TEXT, site TEXT, description TEXT, search_query TEXT,
+                job_type TEXT, is_remote INTEGER, min_amount REAL, max_amount REAL, interval TEXT
+            )
+        """)
+        db.commit()
+        db.close()
+        cli._tls.conn = None
+
+    def tearDown(self):
+        conn = getattr(cli._tls, "conn", None)
+        if conn is not None:
+            conn.close()
+            cli._tls.conn = None
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def search(self, text):
+        console = Console(record=True, width=200, file=io.StringIO())
+        with mock.patch.object(cli, "console", console):
+            cli.search_jobs(text)
+        return console.export_text()
+
+    def test_search_after_vacuum(self):
+        conn = cli.get_db_connection()
+        jobs = [(f"job-{i}", f"Role {i}", f"description number{i}") for i in range(50)]
+        conn.executemany("INSERT INTO scraped_jobs (id, title, description) VALUES (?, ?, ?)", jobs)
+        # Deleting early rows leaves gaps in the implicit rowids that VACUUM closes
+        conn.execute("DELETE FROM scraped_jobs WHERE id IN ('job-0', 'job-1', 'job-2', 'job-3')")
+        conn.execute("VACUUM")
+
+        output = self.search("number42")
+        self.assertIn("job-42", output)
+        self.assertNotIn("job-46", output)
+
+        # search leaves the shared connection query_only
+        conn = cli.get_db_connection()
+        conn.execute("UPDATE scraped_jobs SET description = 'renamed text' WHERE id = 'job-42'")
+        conn.execute("DELETE FROM scraped_jobs WHERE id = 'job-10'")
+        self.assertIn("No jobs found", self.search("number42"))
+        self.assertIn("job-42", self.search("renamed"))
+        self.assertIn("No jobs found", self.search("number10"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Tests for batch detection in scripts/log_parser.py"""
+
+import contextlib
+import io
+import mmap
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import log_parser
+
+
+def find_batches(messages):
+    """Run iter_batches over a log made of messages, returning (start, end, line indexes) per batch"""
+    lines = [f"2025-06-01 10:00:{n:02d},000 - __main__ - INFO - {message}" for n, message in enumerate(messages)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "jobscraper.log")
+        with open(path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with contextlib.redirect_stdout(io.StringIO()):
+                events = log_parser.iter_log_events(mm)
+                return [(start, end, [event[0] for event in batch_events])
+                        for start, end, batch_events in log_parser.iter_batches(events, len(lines))]
+
+
+class IterBatchesTest(unittest.TestCase):
+
+    def test_second_scraper_start_inside_init_window(self):
+        # Another scraper.py run (e.g. a --delete-* command) logs its start between this
+        # batch's "initialized" line and its first search
+        batches = find_batches([
+            "Starting JobSpy Scraper with PostgreSQL",
+            "Connected to PostgreSQL database successfully",
+            "PostgreSQL database initialized (local)",
+            "Starting JobSpy Scraper with PostgreSQL",
+            "Starting search for: Data Analyst",
+            "Search completed for Data Analyst. Found 3 jobs, 1 new.",
+            "JobSpy Scraper finished",
+        ])
+        self.assertEqual(batches, [(2, 6, [2, 3, 4, 5, 6])])
+
+    def test_second_scraper_start_inside_start_window(self):
+        batches = find_batches([
+            "Starting JobSpy Scraper with PostgreSQL",
+            "Connected to PostgreSQL database successfully",
+            "Starting JobSpy Scraper with PostgreSQL",
+            "PostgreSQL database initialized (local)",
+            "Starting search for: Data Analyst",
+            "JobSpy Scraper finished",
+        ])
+        self.assertEqual(batches, [(3, 5, [3, 4, 5])])
+
+    def test_finished_line_before_a_waiting_batch_start_is_confirmed(self):
+        batches = find_batches([
+            "Starting JobSpy Scraper with PostgreSQL",
+            "Connected to PostgreSQL database successfully",
+            "PostgreSQL database initialized (local)",
+            "Starting search for: Data Analyst",
+            "Starting JobSpy Scraper with PostgreSQL",
+            "Connected to PostgreSQL database successfully",
+            "PostgreSQL database initialized (local)",
+            "JobSpy Scraper finished",
+            "Starting search for: ML Engineer",
+        ])
+        # The finished line follows the second start, so it ends the second batch
+        self.assertEqual(batches, [(2, 5, [2, 3, 4, 5]), (6, 7, [6, 7])])
+
+
+if __name__ == "__main__":
+    unittest.main()
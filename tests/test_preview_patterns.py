@@ -0,0 +1,125 @@
+"""Tests for the LIKE pattern matching in scripts/preview_title_deletions.py"""
+
+import os
+import sys
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import preview_title_deletions as ptd
+
+
+TITLES = [
+    "Senior Engineer",          # 0
+    "senior engineer manager",  # 1
+    "100% Remote Nurse",        # 2
+    "Data_Analyst",             # 3
+    "Data Analyst",             # 4
+    None,                       # 5
+    "Sales Rep",                # 6
+    "sales",                    # 7
+    "Nurse Aide",               # 8
+]
+
+
+def match(*patterns):
+    """Match patterns against TITLES, returning the matched positions per pattern"""
+    return ptd._match_patterns(pd.Series(TITLES, dtype=object), list(patterns))
+
+
+class NormalizePatternTest(unittest.TestCase):
+    def test_lowercases_trims_and_collapses_percent_runs(self):
+        self.assertEqual(ptd._normalize_pattern("  %%Senior%%%Engineer%% "), "%senior%engineer%")
+
+    def test_keeps_escaped_percent_out_of_runs(self):
+        self.assertEqual(ptd._normalize_pattern("100\\%%%"), "100\\%%")
+        self.assertEqual(ptd._normalize_pattern("%\\%%"), "%\\%%")
+
+
+class ClassifyPatternTest(unittest.TestCase):
+    def test_kinds(self):
+        self.assertEqual(ptd._classify_pattern("sales"), ("exact", "sales"))
+        self.assertEqual(ptd._classify_pattern("sales%"), ("prefix", "sales"))
+        self.assertEqual(ptd._classify_pattern("%nurse"), ("suffix", "nurse"))
+        self.assertEqual(ptd._classify_pattern("%nurse%"), ("contains", "nurse"))
+        self.assertEqual(ptd._classify_pattern("%"), ("suffix", ""))
+
+    def test_wildcards_and_escapes_inside_are_generic(self):
+        for pattern in ("data_analyst", "%d_ta%", "senior%manager", "100\\%%", "%\\_%"):
+            self.assertEqual(ptd._classify_pattern(pattern), ("generic", pattern))
+
+
+class PrefixRangeTest(unittest.TestCase):
+    def test_range(self):
+        texts = ["a", "ab", "abc", "abd", "b"]
+        self.assertEqual(ptd._prefix_range(texts, "ab"), (1, 4))
+        self.assertEqual(ptd._prefix_range(texts, "abz"), (4, 4))
+        self.assertEqual(ptd._prefix_range(texts, ""), (0, 5))
+
+    def test_prefix_ending_in_the_last_code_point(self):
+        top = chr(sys.maxunicode)
+        texts = ["a", "a" + top, "a" + top + "b", "b"]
+        self.assertEqual(ptd._prefix_range(texts, "a" + top), (1, 3))
+
+
+class CompileLikeTest(unittest.TestCase):
+    def test_escaped_wildcards_are_literal(self):
+        self.assertTrue(ptd._compile_like("100\\%%")("100% remote"))
+        self.assertFalse(ptd._compile_like("100\\%%")("1000 remote"))
+        self.assertTrue(ptd._compile_like("data\\_analyst")("data_analyst"))
+        self.assertFalse(ptd._compile_like("data\\_analyst")("data analyst"))
+
+    def test_underscore_matches_exactly_one_character(self):
+        like = ptd._compile_like("sale_")
+        self.assertTrue(like("sales"))
+        self.assertFalse(like("sale"))
+        self.assertFalse(like("sales rep"))
+
+    def test_underscore_with_outer_percent(self):
+        self.assertTrue(ptd._compile_like("%d_ta%")("big data team"))
+        self.assertTrue(ptd._compile_like("_ales%")("sales rep"))
+        self.assertFalse(ptd._compile_like("_ales%")("ales"))
+        self.assertTrue(ptd._compile_like("%nurs_")("remote nurse"))
+        self.assertFalse(ptd._compile_like("%nurs_")("nurse aide"))
+
+    def test_inner_segments_match_in_order_without_overlap(self):
+        like = ptd._compile_like("%ab%ba%")
+        self.assertTrue(like("ab ba"))
+        self.assertFalse(like("aba"))
+        self.assertFalse(like("ba ab"))
+
+
+class MatchPatternsTest(unittest.TestCase):
+    def test_simple_kinds(self):
+        self.assertEqual(match("sales", "sales%", "%nurse", "%nurse%"), [[7], [6, 7], [2], [2, 8]])
+
+    def test_escaped_percent_and_underscore(self):
+        self.assertEqual(match("%100\\% remote%", "%\\%%", "data\\_analyst"), [[2], [2], [3]])
+
+    def test_underscore_with_and_without_outer_percent(self):
+        self.assertEqual(match("data_analyst", "%d_ta%", "sale_", "_ales%", "%nurs_"),
+                         [[3, 4], [3, 4], [7], [6, 7], [2]])
+
+    def test_percent_runs(self):
+        self.assertEqual(match("%%nurse%%", "senior%%manager", "senior%%%"), [[2, 8], [1], [0, 1]])
+
+    def test_duplicate_patterns_share_results(self):
+        first, again, respelled = match("%Nurse%", "%nurse%", " %%NURSE%% ")
+        self.assertEqual(first, [2, 8])
+        self.assertEqual(again, first)
+        self.assertEqual(respelled, first)
+
+    def test_prefix_covered_patterns(self):
+        self.assertEqual(match("senior%", "senior engineer%", "senior engineer manager%"),
+                         [[0, 1], [0, 1], [1]])
+
+    def test_null_titles_match_as_empty_strings(self):
+        everything = list(range(len(TITLES)))
+        non_null = [pos for pos, title in enumerate(TITLES) if title is not None]
+        self.assertEqual(match("%", "%%", "%_%", "_%", ""), [everything, everything, non_null, non_null, [5]])
+
+
+if __name__ == "__main__":
+    unittest.main()